@@ -67,7 +67,12 @@ FIELD_SECTIONS: list[tuple[str, list[str]]] = [
     ("Providers", ["primary_provider", "fallback_enabled", "fallback_providers"]),
     (
         "Rate limiting",
-        ["rate_limit_enabled", "max_requests_per_minute", "max_concurrent_requests"],
+        [
+            "rate_limit_enabled",
+            "max_requests_per_minute",
+            "max_concurrent_requests",
+            "provider_batch_size",
+        ],
     ),
     (
         "Circuit breaker",
@@ -99,6 +104,8 @@ FIELD_SECTIONS: list[tuple[str, list[str]]] = [
             "cache_ttl",
             "cache_max_size",
             "cache_storage_format",
+            "cache_key_hash",
+            "cache_memory_entries",
             "cache_compression_enabled",
             "cache_compression_level",
             "cache_max_age",
@@ -135,10 +142,14 @@ INLINE_COMMENTS: dict[str, str] = {
     "overlap_duration": "0..30 seconds",
     "overlap_strategy": "weighted | longest",
     "min_segment_length": "minimum segment duration in seconds",
+    "provider_batch_size": "1..32 segments coalesced per worker request batch",
     "circuit_breaker_threshold": "consecutive failures",
     "circuit_breaker_reset_timeout": "seconds",
     "cache_ttl": "seconds",
     "cache_max_size": "bytes (~1MB default)",
+    "cache_storage_format": "json | orjson (needs the orjson package)",
+    "cache_key_hash": "sha256 | xxh3 (needs the xxhash package)",
+    "cache_memory_entries": "0..65536 recently read entries kept in memory; 0 = off",
     "cache_compression_level": "1..9",
     "cache_max_age": "seconds",
     "cache_min_free_space": "bytes",
@@ -7,6 +7,9 @@ information is retrieved from the _version.py file if available, otherwise it fa
 back to the package metadata.
 """
 
+# Standard library imports
+from functools import lru_cache
+
 # Local/package imports
 from .utils.logger import get_logger
 
@@ -14,27 +17,41 @@ from .utils.logger import get_logger
 package_logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
 def get_metadata():
     """
     Extract version and metadata from package distribution.
 
-    This function is used in the generated `__init__.py` to extract the package
-    version and metadata from the distribution. It is used as a fallback when the
-    `importlib.metadata` module is not available.
+    The distribution metadata is read once (``metadata()`` scans ``sys.path``
+    and parses the METADATA file) and every field is taken from that single
+    result; repeated calls return the cached mapping.
 
     Returns
     -------
-    list
-        A list of strings containing the version, title, author, and license of
-        the package.
+    dict
+        Mapping of ``__version__``, ``__title__``, ``__author__`` and
+        ``__license__`` to their values from the package metadata.
     """
     from importlib.metadata import metadata
 
     _meta = metadata("tracklistify")
 
-    __all__ = ["__version__", "__title__", "__author__", "__license__"]
-
-    return __all__
-
-
-__all__ = get_metadata()
+    return {
+        "__version__": _meta["Version"],
+        "__title__": _meta["Name"],
+        "__author__": _meta["Author"],
+        # PEP 639 metadata carries the SPDX expression; older builds use License
+        "__license__": _meta["License-Expression"] or _meta["License"],
+    }
+
+
+try:
+    from ._version import __author__, __license__, __title__, __version__
+except ImportError:  # pragma: no cover - only if _version.py is missing
+    _metadata = get_metadata()
+    __version__ = _metadata["__version__"]
+    __title__ = _metadata["__title__"]
+    __author__ = _metadata["__author__"]
+    __license__ = _metadata["__license__"]
+
+__all__ = ["__version__", "__title__", "__author__", "__license__"]
@@ -0,0 +1,12 @@
+"""Package version and metadata as literals.
+
+Imported by ``tracklistify/__init__.py`` so that ``import tracklistify`` does
+not pay for ``importlib.metadata``. ``__version__`` is rewritten by ``cz bump``
+(see ``version_files`` in ``pyproject.toml``); keep it in step with
+``[project].version``.
+"""
+
+__version__ = "0.11.1"
+__title__ = "tracklistify"
+__author__ = "betmoar"
+__license__ = "MIT"
@@ -13,7 +13,7 @@ from .factory import (
     get_cache,
 )
 from .invalidation import CompositeStrategy, LRUStrategy, SizeStrategy, TTLStrategy
-from .storage import JSONStorage
+from .storage import JSONStorage, ORJSONStorage
 
 __all__ = [
     "BaseCache",
@@ -26,4 +26,5 @@ __all__ = [
     "SizeStrategy",
     "CompositeStrategy",
     "JSONStorage",
+    "ORJSONStorage",
 ]
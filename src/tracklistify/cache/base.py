@@ -3,7 +3,6 @@ Base cache implementation with enhanced features.
 """
 
 # Standard library imports
-import json
 import time
 from typing import Any, Dict, Generic, Optional, TypeVar, cast
 
@@ -80,14 +79,14 @@ class BaseCache(Generic[T]):
             # Get entry from storage
             entry = await self._storage.get(key)
             if entry is None:
-                logger.debug(f"Cache miss: {key}")
+                logger.debug("Cache miss: %s", key)
                 self._stats["misses"] += 1
                 return None
 
             # Check if entry is valid
             is_valid = await self._invalidation_strategy.is_valid(entry)
             if not is_valid:
-                logger.debug(f"Cache entry invalid: {key}")
+                logger.debug("Cache entry invalid: %s", key)
                 await self.delete(key)
                 self._stats["invalidations"] += 1
                 self._stats["misses"] += 1
@@ -141,6 +140,8 @@ class BaseCache(Generic[T]):
             # TTLStrategy does metadata.get("ttl", default_ttl), and a
             # present-but-None key shadows the default, so is_valid always
             # returned True. Locked by tests/test_handoff_invariants.py.
+            # ``size`` is left to the storage backend, which stamps it from
+            # the bytes it actually serializes rather than encoding twice.
             entry = cast(
                 CacheEntry[T],
                 {
@@ -151,7 +152,6 @@ class BaseCache(Generic[T]):
                         "last_accessed": time.time(),
                         "ttl": ttl if ttl is not None else self._ttl,
                         "compression": compression,
-                        "size": len(json.dumps(value)),
                     },
                 },
             )
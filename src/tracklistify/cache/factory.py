@@ -8,7 +8,7 @@ from typing import Optional, Union
 # Local imports
 from .base import BaseCache
 from .invalidation import CompositeStrategy, LRUStrategy, SizeStrategy, TTLStrategy
-from .storage import JSONStorage
+from .storage import JSONStorage, ORJSONStorage, orjson
 from tracklistify.core.types import CacheStorage, InvalidationStrategy
 from tracklistify.utils.constants import DEFAULT_CACHE_MAX_SIZE, DEFAULT_CACHE_TTL
 from tracklistify.utils.logger import get_logger
@@ -22,16 +22,37 @@ _cache_instance = None
 _cache_lock = threading.Lock()
 
 
+def _create_storage(cache_path: Path, storage_format: str) -> CacheStorage:
+    """Build the storage backend named by ``cache_storage_format``.
+
+    ``"orjson"`` is an optional accelerator: without the package installed
+    it degrades to the stdlib ``JSONStorage`` (same on-disk format) with a
+    warning rather than failing the run.
+    """
+    if storage_format == "orjson":
+        if orjson is not None:
+            return ORJSONStorage(str(cache_path))
+        logger.warning(
+            "cache_storage_format=orjson but orjson is not installed; "
+            "using the stdlib json storage"
+        )
+    elif storage_format != "json":
+        logger.warning(f"Unknown cache_storage_format {storage_format!r}; using json")
+    return JSONStorage(str(cache_path))
+
+
 def create_cache(
     cache_dir: Optional[Union[Path, str]] = None,
     ttl: int = DEFAULT_CACHE_TTL,
     max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    storage_format: str = "json",
 ) -> BaseCache:
     """Create a new cache instance.
 
     Resolves ``cache_dir`` (string or Path), expands ``~``, ensures the
     directory exists, and wires the standard CompositeStrategy
-    (TTL + LRU + Size) onto a JSON-backed storage.
+    (TTL + LRU + Size) onto a JSON-backed storage (stdlib ``json``, or
+    ``orjson`` when ``storage_format="orjson"``).
     """
     cache_path = cache_dir or DEFAULT_CACHE_DIR
     if isinstance(cache_path, str):
@@ -39,7 +60,7 @@ def create_cache(
     cache_path = cache_path.expanduser()
     cache_path.mkdir(parents=True, exist_ok=True)
 
-    storage: CacheStorage = JSONStorage(str(cache_path))
+    storage = _create_storage(cache_path, storage_format)
     strategy: InvalidationStrategy = CompositeStrategy(
         [TTLStrategy(ttl), LRUStrategy(ttl), SizeStrategy(max_size)]
     )
@@ -85,6 +106,7 @@ def get_cache(force_refresh: bool = False) -> BaseCache:
                 cache_dir=getattr(cfg, "cache_dir", None),
                 ttl=getattr(cfg, "cache_ttl", DEFAULT_CACHE_TTL),
                 max_size=getattr(cfg, "cache_max_size", DEFAULT_CACHE_MAX_SIZE),
+                storage_format=getattr(cfg, "cache_storage_format", "json"),
             )
 
     return _cache_instance
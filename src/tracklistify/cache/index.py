@@ -14,6 +14,11 @@ from typing import Any, Dict, List, Optional, TypeVar, Union
 # Third-party imports
 import aiofiles
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the index parses with stdlib json
+    orjson = None
+
 # Local/package imports
 from tracklistify.utils.logger import get_logger
 
@@ -45,14 +50,19 @@ class CacheIndex:
         async with self._lock:
             try:
                 if self._index_file.exists():
-                    async with aiofiles.open(self._index_file, "r") as f:
-                        content = await f.read()
+                    # Parse the UTF-8 bytes directly (orjson when available);
+                    # skips text-mode decoding and aiofiles' per-call hops.
+                    content = await asyncio.to_thread(self._index_file.read_bytes)
+                    if orjson is not None:
+                        self._index = orjson.loads(content)
+                    else:
                         self._index = json.loads(content)
                     logger.debug(f"Loaded cache index with {len(self._index)} entries")
                 else:
                     logger.info("Index file not found, rebuilding from cache files")
                     await self._rebuild_index()
-            except (json.JSONDecodeError, OSError) as e:
+            except (ValueError, OSError) as e:
+                # ValueError covers json/orjson decode errors and bad UTF-8
                 logger.warning(f"Index file corrupted: {e}, rebuilding")
                 await self._rebuild_index()
 
@@ -69,9 +79,10 @@ class CacheIndex:
                 async with aiofiles.open(temp_file, "w") as f:
                     await f.write(json.dumps(self._index, indent=2))
                     await f.flush()
-                    # fsync before rename, matching JSONStorage.set(): a
-                    # crash between flush and rename must not leave a
-                    # truncated index that load() then treats as corrupt.
+                    # fsync before rename: a crash between flush and
+                    # rename must not leave a truncated index that load()
+                    # then treats as corrupt. (Entry files skip this; a torn
+                    # entry just decodes as a miss.)
                     os.fsync(f.fileno())
 
                 # Atomic replace
@@ -210,10 +221,15 @@ class CacheIndex:
         Returns:
             Dict with 'missing_files' and 'orphaned_files' lists
         """
-        # Get all cache files from filesystem
-        cache_files = set()
-        for path in self._cache_dir.rglob("*.cache"):
-            cache_files.add(path.name)
+        # Entries are written flat into ``_cache_dir``; a single scandir pass
+        # lists them without recursing into ``downloads/`` (large audio files)
+        # or touching file contents.
+        with os.scandir(self._cache_dir) as it:
+            cache_files = {
+                entry.name
+                for entry in it
+                if entry.name.endswith(".cache") and entry.is_file()
+            }
 
         # Get all files from index
         index_files = set()
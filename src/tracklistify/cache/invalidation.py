@@ -8,7 +8,7 @@ import json
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Generic, List, Optional, TypeVar, cast
+from typing import Any, Callable, Generic, List, Optional, TypeVar, cast
 
 # Local/package imports
 from tracklistify.core.types import CacheEntry, CacheStorage
@@ -23,6 +23,14 @@ T = TypeVar("T")
 class InvalidationStrategy(Generic[T], ABC):
     """Base class for cache invalidation strategies."""
 
+    _time_source: Optional[Callable[[], float]] = None
+
+    def _now(self) -> float:
+        """Current epoch seconds from the injected clock, else time.time()."""
+        if self._time_source is None:
+            return time.time()
+        return self._time_source()
+
     @abstractmethod
     async def is_valid(self, entry: CacheEntry[T]) -> bool:
         """Check if entry is still valid."""
@@ -50,14 +58,25 @@ class InvalidationStrategy(Generic[T], ABC):
 
 
 class TTLStrategy(InvalidationStrategy[T]):
-    """Time-based invalidation strategy."""
-
-    def __init__(self, default_ttl: Optional[int] = None):
+    """Time-based invalidation strategy.
+
+    ``time_source`` returns the current epoch time in seconds (defaults to
+    ``time.time``); tests inject a manual clock so expiry can be driven
+    without sleeping.
+    """
+
+    def __init__(
+        self,
+        default_ttl: Optional[int] = None,
+        *,
+        time_source: Optional[Callable[[], float]] = None,
+    ):
         # Handle both int (seconds) and timedelta objects
         if isinstance(default_ttl, timedelta):
             self.default_ttl: Optional[int] = int(default_ttl.total_seconds())
         else:
             self.default_ttl = default_ttl
+        self._time_source = time_source
 
     async def is_valid(self, entry: CacheEntry[T]) -> bool:
         """Check if entry is still valid based on TTL."""
@@ -69,7 +88,7 @@ class TTLStrategy(InvalidationStrategy[T]):
             if ttl is None:
                 return True
 
-            return time.time() - created_time < ttl
+            return self._now() - created_time < ttl
 
         except Exception as e:
             logger.error(f"Error checking TTL validity: {str(e)}")
@@ -79,7 +98,7 @@ class TTLStrategy(InvalidationStrategy[T]):
         """Update entry metadata."""
         try:
             entry = copy.deepcopy(entry)
-            entry["metadata"]["last_accessed"] = time.time()
+            entry["metadata"]["last_accessed"] = self._now()
             return entry
         except Exception as e:
             logger.error(f"Error updating TTL metadata: {str(e)}")
@@ -97,32 +116,23 @@ class TTLStrategy(InvalidationStrategy[T]):
             if self.default_ttl is None:
                 return False
 
+            # BaseCache.set stamps ``created`` (epoch seconds); older
+            # entries may carry ``created_at`` instead.
             metadata = entry["metadata"]
-            created_at = metadata.get("created_at")
+            created_at = metadata.get("created", metadata.get("created_at"))
             if not created_at:
                 return True
 
+            # Epoch timestamps compare as plain numbers; only legacy ISO
+            # strings need parsing.
             if isinstance(created_at, str):
-                created_time = datetime.fromisoformat(created_at)
-            else:
-                created_time = datetime.fromtimestamp(created_at)
+                created_at = datetime.fromisoformat(created_at).timestamp()
 
-            current_time = datetime.now()
-            age = current_time - created_time
+            age = self._now() - created_at
 
-            if isinstance(self.default_ttl, int):
-                ttl = timedelta(seconds=self.default_ttl)
-            else:
-                ttl = self.default_ttl
+            logger.debug("TTL check: age=%.3fs, ttl=%ss", age, self.default_ttl)
 
-            logger.debug(
-                (
-                    f"TTL check: current={current_time}, created={created_time}, "
-                    f"age={age}, ttl={ttl}"
-                )
-            )
-
-            return age > ttl
+            return age > self.default_ttl
 
         except Exception as e:
             logger.error(f"Error in TTL invalidation check: {str(e)}")
@@ -135,16 +145,25 @@ class TTLStrategy(InvalidationStrategy[T]):
 
     def update_last_access(self, entry: CacheEntry[T]) -> None:
         """Update last access time."""
-        current_time = datetime.now()
+        current_time = datetime.fromtimestamp(self._now())
         entry["metadata"]["last_accessed"] = current_time.isoformat()
-        logger.debug(f"TTL update: last_accessed={current_time}")
+        logger.debug("TTL update: last_accessed=%s", current_time)
 
 
 class LRUStrategy(InvalidationStrategy[T]):
-    """Least Recently Used invalidation strategy."""
+    """Least Recently Used invalidation strategy.
+
+    ``time_source`` works as in :class:`TTLStrategy`.
+    """
 
-    def __init__(self, max_age: Optional[int] = None):
+    def __init__(
+        self,
+        max_age: Optional[int] = None,
+        *,
+        time_source: Optional[Callable[[], float]] = None,
+    ):
         self.max_age = max_age
+        self._time_source = time_source
 
     async def is_valid(self, entry: CacheEntry[T]) -> bool:
         """Check if entry is valid based on last access time."""
@@ -164,12 +183,15 @@ class LRUStrategy(InvalidationStrategy[T]):
             else:
                 last_accessed = metadata["last_accessed"]
 
-            current_time = time.time()
+            current_time = self._now()
             age = current_time - last_accessed
 
             logger.debug(
-                f"LRU check: current={current_time}, last={last_accessed}, "
-                f"age={age}, max_age={self.max_age}"
+                "LRU check: current=%s, last=%s, age=%s, max_age=%s",
+                current_time,
+                last_accessed,
+                age,
+                self.max_age,
             )
 
             # Add a small buffer to account for timing variations
@@ -186,7 +208,7 @@ class LRUStrategy(InvalidationStrategy[T]):
             if not await self.is_valid(entry):
                 return entry
 
-            current_time = time.time()
+            current_time = self._now()
 
             # Initialize metadata if not present
             if "metadata" not in entry:
@@ -202,7 +224,7 @@ class LRUStrategy(InvalidationStrategy[T]):
 
             # Update last accessed time
             updated_entry["metadata"]["last_accessed"] = current_time
-            logger.debug(f"LRU update: last_accessed={current_time}")
+            logger.debug("LRU update: last_accessed=%s", current_time)
 
             return updated_entry
         except Exception as e:
@@ -238,14 +260,15 @@ class LRUStrategy(InvalidationStrategy[T]):
                 except ValueError:
                     return True
 
-            current_time = time.time()
+            current_time = self._now()
             age = current_time - float(last_accessed)
 
             logger.debug(
-                (
-                    f"LRU check: current={current_time}, last={last_accessed}, "
-                    f"age={age}, max_age={self.max_age}"
-                )
+                "LRU check: current=%s, last=%s, age=%s, max_age=%s",
+                current_time,
+                last_accessed,
+                age,
+                self.max_age,
             )
 
             # Entry is valid if age is less than max_age
@@ -257,9 +280,9 @@ class LRUStrategy(InvalidationStrategy[T]):
 
     def update_last_access(self, entry: CacheEntry[T]) -> None:
         """Update last access time."""
-        current_time = time.time()
+        current_time = self._now()
         entry["metadata"]["last_accessed"] = current_time
-        logger.debug(f"LRU update: last_accessed={current_time}")
+        logger.debug("LRU update: last_accessed=%s", current_time)
 
 
 class SizeStrategy(InvalidationStrategy[T]):
@@ -330,10 +353,8 @@ class CompositeStrategy(InvalidationStrategy[T]):
             for strategy in self.strategies:
                 if not await strategy.is_valid(entry):
                     logger.debug(
-                        (
-                            f"Entry invalid according to strategy: "
-                            f"{strategy.__class__.__name__}"
-                        )
+                        "Entry invalid according to strategy: %s",
+                        strategy.__class__.__name__,
                     )
                     return False
             return True
@@ -368,10 +389,8 @@ class CompositeStrategy(InvalidationStrategy[T]):
             for strategy in self.strategies:
                 if strategy.should_invalidate(entry):
                     logger.debug(
-                        (
-                            f"Strategy {strategy.__class__.__name__} "
-                            "indicates entry should be invalidated"
-                        )
+                        "Strategy %s indicates entry should be invalidated",
+                        strategy.__class__.__name__,
                     )
                     return True
             return False
@@ -8,11 +8,20 @@ import hashlib
 import json
 import os
 import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 # Third-party imports
-import aiofiles
+try:
+    import orjson
+except ImportError:  # optional accelerator; JSONStorage needs only stdlib json
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # optional accelerator for cache_key_hash = "xxh3"
+    xxhash = None
 
 from tracklistify.cache.index import CacheIndex
 from tracklistify.config.factory import get_config
@@ -28,33 +37,106 @@ ZLIB_HEADER = b"\x78\x9c"
 
 T = TypeVar("T")
 
+# Per-key file locks are striped over a fixed pool instead of one Lock per
+# key ever seen, which grew without bound. Power of two for the mask below.
+_LOCK_SHARDS = 64
+
+
+def _sha256_hexdigest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _get_key_hasher(name: str) -> Callable[[str], str]:
+    """Return the key-to-filename hash named by ``cache_key_hash``."""
+    if name == "xxh3":
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest
+        logger.warning("cache_key_hash=xxh3 but xxhash is not installed; using sha256")
+    elif name != "sha256":
+        logger.warning(f"Unknown cache_key_hash {name!r}; using sha256")
+    return _sha256_hexdigest
+
+
+async def _read_bytes(path: str) -> bytes:
+    """Read a whole file in one worker-thread hop.
+
+    aiofiles dispatches open/read/close as separate executor calls; cache
+    entries are small, so a single ``to_thread`` round-trip is cheaper.
+    """
+    return await asyncio.to_thread(Path(path).read_bytes)
+
+
+async def _write_bytes(path: str, data: bytes) -> None:
+    """Write a whole file in one worker-thread hop.
+
+    No fsync: entries are disposable, and a file torn by a crash fails to
+    decode in ``get()``, which drops it and reports a miss. The index, which
+    cannot be lost that cheaply, still fsyncs in ``CacheIndex.save``.
+    """
+    await asyncio.to_thread(Path(path).write_bytes, data)
+
 
 class JSONStorage(CacheStorage[T]):
     """JSON file-based cache storage."""
 
-    def __init__(self, cache_dir: Union[str, Path]):
-        """Initialize storage with cache directory."""
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        memory_entries: Optional[int] = None,
+    ):
+        """Initialize storage with cache directory.
+
+        ``memory_entries`` (default: ``cache_memory_entries`` from config)
+        bounds an in-process LRU of the raw JSON bytes of recently read
+        entries, so re-reading a key skips the file read. It holds bytes,
+        not decoded dicts: each hit parses a fresh entry, so callers can
+        mutate what they get without a defensive deep copy. Only reads
+        fill it; every write path (set/delete/evict/clear) drops the key.
+        0 disables it.
+        """
         # Lazy import to avoid circular dependency
         from tracklistify.config import get_config
 
         self._config = get_config()
+        self._hash_key = _get_key_hasher(
+            getattr(self._config, "cache_key_hash", "sha256")
+        )
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_SHARDS)]
         self._index = CacheIndex(cache_dir)
         self._index_loaded = False
+        if memory_entries is None:
+            memory_entries = getattr(self._config, "cache_memory_entries", 256)
+        self._memory_entries = max(0, memory_entries)
+        self._hot: OrderedDict[str, bytes] = OrderedDict()
+
+    def _dumps(self, entry: CacheEntry[T]) -> bytes:
+        """Serialize an entry to the bytes written to disk."""
+        return json.dumps(entry).encode("utf-8")
+
+    def _loads(self, data: bytes) -> Any:
+        """Deserialize bytes read from disk."""
+        return json.loads(data.decode("utf-8"))
 
     def _get_file_path(self, key: str) -> str:
         """Get file path for key."""
         # Use hash to avoid filesystem issues with special characters
-        hashed_key = hashlib.sha256(key.encode()).hexdigest()
+        hashed_key = self._hash_key(key)
         return os.path.join(self._cache_dir, f"{hashed_key}.cache")
 
     def _get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for the given key."""
-        if key not in self._locks:
-            self._locks[key] = asyncio.Lock()
-        return self._locks[key]
+        """Get the lock shard guarding the given key."""
+        return self._locks[hash(key) & (_LOCK_SHARDS - 1)]
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Put ``data`` in the hot tier, evicting the least recently used."""
+        if not self._memory_entries:
+            return
+        self._hot[key] = data
+        self._hot.move_to_end(key)
+        while len(self._hot) > self._memory_entries:
+            self._hot.popitem(last=False)
 
     def _safe_cache_path(self, filename: str) -> Optional[str]:
         """Build a cache path from an index-sourced filename, or None.
@@ -93,27 +175,33 @@ class JSONStorage(CacheStorage[T]):
             # Get filename from index for faster lookup
             filename = await self._index.get_filename(key)
             if filename is None:
+                self._hot.pop(key, None)
                 return None
 
-            file_path = self._safe_cache_path(filename)
-            if file_path is None:
-                # Tampered index entry with a directory component — drop it
-                # and persist the removal, mirroring delete(); otherwise the
-                # bad entry survives on disk and is re-rejected every run.
-                await self._index.remove_entry(key)
-                await self._index.save()
-                return None
-            if not os.path.exists(file_path):
-                # File missing but in index - remove from index and persist,
-                # so the stale entry doesn't survive on disk and get
-                # re-checked (and re-removed) every run.
-                await self._index.remove_entry(key)
-                await self._index.save()
-                return None
+            index_meta = await self._index.get_metadata(key) or {}
+            data = self._hot.get(key)
+            if data is not None:
+                self._hot.move_to_end(key)
+            else:
+                file_path = self._safe_cache_path(filename)
+                if file_path is None:
+                    # Tampered index entry with a directory component — drop
+                    # it and persist the removal, mirroring delete();
+                    # otherwise the bad entry survives on disk and is
+                    # re-rejected every run.
+                    await self._index.remove_entry(key)
+                    await self._index.save()
+                    return None
+                if not os.path.exists(file_path):
+                    # File missing but in index - remove from index and
+                    # persist, so the stale entry doesn't survive on disk and
+                    # get re-checked (and re-removed) every run.
+                    await self._index.remove_entry(key)
+                    await self._index.save()
+                    return None
 
-            async with self._get_lock(key):
-                async with aiofiles.open(file_path, "rb") as f:
-                    data = await f.read()
+                async with self._get_lock(key):
+                    data = await _read_bytes(file_path)
 
                 # Handle compression. The authoritative signal is the
                 # ``compression`` flag the index records per key (written on
@@ -124,25 +212,38 @@ class JSONStorage(CacheStorage[T]):
                 # alone is unsafe once the flag exists. ``False`` is an explicit
                 # "not compressed"; only a MISSING field (legacy entry) sniffs.
                 try:
-                    index_meta = await self._index.get_metadata(key) or {}
                     if "compression" in index_meta:
                         compressed = bool(index_meta["compression"])
                     else:
                         compressed = data.startswith(ZLIB_HEADER)
                     if compressed:
                         data = zlib.decompress(data)
-                    entry = json.loads(data.decode("utf-8"))
-
-                    # Update access time in index
-                    await self._index.update_access_time(key)
-
-                    return entry
-                except (zlib.error, json.JSONDecodeError) as e:
+                except zlib.error as e:
                     logger.error(f"Error decoding cache entry: {str(e)}")
                     # Remove corrupted entry from index
                     await self._index.remove_entry(key)
                     return None
 
+            try:
+                entry = self._loads(data)
+            except json.JSONDecodeError as e:
+                logger.error(f"Error decoding cache entry: {str(e)}")
+                self._hot.pop(key, None)
+                # Remove corrupted entry from index
+                await self._index.remove_entry(key)
+                return None
+            self._remember(key, data)
+
+            # ``size`` is measured after serialization in set(), so it lives
+            # in the index rather than in the file body.
+            if "size" in index_meta:
+                entry.setdefault("metadata", {})["size"] = index_meta["size"]
+
+            # Update access time in index
+            await self._index.update_access_time(key)
+
+            return entry
+
         except Exception as e:
             logger.error(f"Error reading cache entry: {str(e)}")
             return None
@@ -160,24 +261,31 @@ class JSONStorage(CacheStorage[T]):
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
             async with self._get_lock(key):
-                # Convert to JSON and optionally compress
-                data = json.dumps(entry).encode("utf-8")
+                self._hot.pop(key, None)
+
+                # Convert to JSON and optionally compress. ``size`` is the
+                # serialized payload, before compression — the figure
+                # SizeStrategy compares against ``max_size``.
+                data = self._dumps(entry)
+                size = len(data)
                 if compression:
                     data = zlib.compress(data)
 
                 # Write atomically using temporary file
                 temp_path = file_path + ".tmp"
-                async with aiofiles.open(temp_path, "wb") as f:
-                    await f.write(data)
-                    await f.flush()
-                    os.fsync(f.fileno())
+                await _write_bytes(temp_path, data)
 
                 os.replace(temp_path, file_path)
                 temp_path = None  # Clear after successful move
 
                 # Update index
-                metadata = entry.get("metadata", {})
-                metadata["size"] = len(data)
+                # A copy, so the caller's entry isn't mutated; ``compression``
+                # is what get() trusts to decide whether to decompress.
+                metadata = {
+                    **entry.get("metadata", {}),
+                    "size": size,
+                    "compression": compression,
+                }
                 await self._index.add_entry(key, filename, metadata)
 
             # Persist the index NOW. It used to be saved only from
@@ -202,6 +310,8 @@ class JSONStorage(CacheStorage[T]):
         try:
             await self._ensure_index_loaded()
 
+            self._hot.pop(key, None)
+
             # Get filename from index
             filename = await self._index.remove_entry(key)
             if filename is None:
@@ -223,10 +333,28 @@ class JSONStorage(CacheStorage[T]):
             logger.error(f"Error deleting cache entry: {str(e)}")
             raise
 
+    async def _evict(self, key: str) -> None:
+        """Drop ``key`` from the index and unlink its file, without saving.
+
+        The batch counterpart of ``delete()``: the caller is responsible for
+        persisting the index once the whole batch is done.
+        """
+        self._hot.pop(key, None)
+        filename = await self._index.remove_entry(key)
+        if filename is None:
+            return
+        file_path = self._safe_cache_path(filename)
+        if file_path is None:
+            return
+        async with self._get_lock(key):
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
     async def clear(self) -> None:
         """Clear all values from storage."""
         try:
             await self._ensure_index_loaded()
+            self._hot.clear()
 
             for path in self._cache_dir.rglob("*.cache"):
                 path.unlink()
@@ -261,13 +389,23 @@ class JSONStorage(CacheStorage[T]):
             # Get expired keys from index
             expired_keys = await self._index.cleanup_expired(max_age)
 
-            # Delete expired entries
-            for key in expired_keys:
-                try:
-                    await self.delete(key)
+            # Evict expired entries as one batch. delete() persists the index
+            # after every key (an fsync'd rewrite of the whole index); here
+            # the removals accumulate and the single save() below covers
+            # them all.
+            results = await asyncio.gather(
+                *(self._evict(key) for key in expired_keys), return_exceptions=True
+            )
+            for key, result in zip(expired_keys, results, strict=True):
+                # return_exceptions also hands back a CancelledError (a
+                # BaseException): that eviction didn't happen, and the
+                # cancellation must propagate rather than count as success.
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to delete expired entry {key}: {result}")
+                else:
                     count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to delete expired entry {key}: {e}")
 
             # Verify integrity and clean up orphaned files
             integrity = await self._index.verify_integrity()
@@ -313,3 +451,29 @@ class JSONStorage(CacheStorage[T]):
         except Exception as e:
             logger.error(f"Error getting storage stats: {str(e)}")
             return {"entries": 0, "total_size_bytes": 0, "index_size_bytes": 0}
+
+
+class ORJSONStorage(JSONStorage[T]):
+    """JSONStorage serialized with orjson instead of the stdlib encoder.
+
+    The on-disk format is still JSON, so the two backends read each other's
+    files and switching ``cache_storage_format`` doesn't invalidate the
+    cache. ``OPT_NON_STR_KEYS`` mirrors ``json.dumps`` coercing int keys to
+    strings; ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``,
+    so ``get()``'s corrupt-entry handling is unchanged.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        memory_entries: Optional[int] = None,
+    ):
+        if orjson is None:
+            raise ImportError("ORJSONStorage requires the orjson package")
+        super().__init__(cache_dir, memory_entries)
+
+    def _dumps(self, entry: CacheEntry[T]) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
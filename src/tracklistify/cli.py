@@ -1,24 +1,28 @@
 # Standard library imports
 import argparse
 import asyncio
+import logging
 import os
 import shutil
 import signal
 import sys
+from functools import lru_cache
 from pathlib import Path
-
-from dotenv import load_dotenv
-
-from .config import ConfigError, get_config, get_root
-from .config.security import mask_sensitive_value
-from .core import ApplicationError, AsyncApp
+from typing import Dict, Optional
 
 # Local/package imports
+# Only leaf modules are imported eagerly. ``.config``, ``.core.base`` and
+# ``dotenv`` are deferred into the functions that use them so ``--help`` and
+# argument errors don't pay for the shazamio/pydub/aiohttp import graph.
+from .core.exceptions import ApplicationError, ConfigError
+from .utils.event_loop import run_async
 from .utils.logger import get_logger, set_logger
 
 # Get the logger for this module
 logger = get_logger(__name__)
 
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
 
 async def main(args: argparse.Namespace) -> int:
     """Main entry point.
@@ -29,6 +33,9 @@ async def main(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure, 130 for SIGINT)
     """
+    from .config import get_config
+    from .core import AsyncApp
+
     app = None  # Initialize app to None
     main_task = asyncio.current_task()
     interrupt_count = 0
@@ -54,8 +61,9 @@ async def main(args: argparse.Namespace) -> int:
         if main_task is not None and not main_task.done():
             main_task.cancel()
 
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        asyncio.get_event_loop().add_signal_handler(sig, signal_handler)
+    loop = asyncio.get_running_loop()
+    for sig in _SHUTDOWN_SIGNALS:
+        loop.add_signal_handler(sig, signal_handler)
 
     try:
         # Load configuration
@@ -103,16 +111,18 @@ async def main(args: argparse.Namespace) -> int:
             except asyncio.CancelledError:
                 # Second Ctrl+C arrived during teardown — proceed to exit.
                 logger.debug("Teardown cancelled by second interrupt")
+        # The handlers close over this call's task; leaving them on a loop
+        # that outlives main() would cancel a stale (or unrelated) task.
+        for sig in _SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(sig)
 
 
-def parse_args(argv=None) -> argparse.Namespace:
-    """Parse command line arguments.
-
-    Args:
-        argv: Optional list of arguments for testing. If None, uses sys.argv.
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it.
 
-    Returns:
-        Parsed arguments namespace
+    ``parse_args`` doesn't mutate the parser, so repeat calls (the test
+    suite parses hundreds of argv lists) skip rebuilding every action.
     """
     parser = argparse.ArgumentParser(
         prog="tracklistify",
@@ -213,6 +223,20 @@ def parse_args(argv=None) -> argparse.Namespace:
         help="Enable debug logging",
     )
 
+    return parser
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Optional list of arguments for testing. If None, uses sys.argv.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = _get_parser()
+
     # A bare invocation is a question ("what is this?"), not a mistake.
     # argparse would answer it with a usage line and exit 2; full help and
     # exit 0 is the useful reading. An argv with actual content still gets
@@ -224,22 +248,52 @@ def parse_args(argv=None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+@lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime_ns: int) -> Dict[str, Optional[str]]:
+    """Parse a ``.env`` file, memoized on its path and modification time.
+
+    Repeated loads of an unchanged file (tests, or anything calling
+    ``cli()`` more than once per process) reuse the parsed mapping; an edit
+    bumps ``mtime_ns`` and forces a re-parse. Callers must not mutate the
+    returned dict.
+    """
+    from dotenv import dotenv_values
+
+    return dotenv_values(path)
+
+
 def load_environment_variables(env_path: Path) -> None:
-    """Load environment variables from a file."""
-    if env_path.exists():
-        load_dotenv(env_path)
-        logger.info(f"Loaded environment from {env_path}")
-
-        # Log loaded environment variables for debugging (mask sensitive values)
-        for key, value in os.environ.items():
-            if key.startswith("TRACKLISTIFY_"):
-                # Mask sensitive values to prevent credential exposure
-                display_value = mask_sensitive_value(key, value)
+    """Load environment variables from a file.
+
+    The file is parsed once per modification (see ``_parse_env_file``);
+    keys already set in the process environment win, as with
+    ``load_dotenv``. The debug listing covers only the keys the file
+    defines, and is skipped entirely unless DEBUG is enabled.
+    """
+    from .config.security import mask_sensitive_value
+
+    try:
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except OSError:
+        return
+    values = _parse_env_file(str(env_path), mtime_ns)
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    logger.info(f"Loaded environment from {env_path}")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # Mask sensitive values to prevent credential exposure
+        for key in values:
+            if key.startswith("TRACKLISTIFY_") and key in os.environ:
+                display_value = mask_sensitive_value(key, os.environ[key])
                 logger.debug(f"Loaded env var: {key}={display_value}")
 
 
 def cli() -> None:
     """Core CLI execution logic"""
+    # Parse first: --help, a bare invocation and argparse errors all exit
+    # here, before any logger, filesystem or .env work is done.
     args = parse_args()
 
     # Setup logging
@@ -264,12 +318,14 @@ def cli() -> None:
         )
         sys.exit(1)
 
+    from .config import get_root
+
     # Load environment variables first
     env_path = get_root() / ".env"
     load_environment_variables(env_path)
 
     try:
-        exit_code = asyncio.run(main(args))
+        exit_code = run_async(main(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
@@ -1,5 +1,9 @@
 # tracklistify/config/__init__.py
-"""Configuration management."""
+"""Configuration management.
+
+``ConfigDocGenerator`` is loaded lazily via PEP 562 ``__getattr__``: the
+documentation generator is only needed by tooling, not by ``get_config()``.
+"""
 
 # Local imports
 from .base import BaseConfig, TrackIdentificationConfig
@@ -14,4 +18,13 @@ __all__ = [
     "ConfigError",
     "get_root",
     "clear_root",
+    "ConfigDocGenerator",
 ]
+
+
+def __getattr__(name: str):
+    if name == "ConfigDocGenerator":
+        from .docs import ConfigDocGenerator
+
+        return ConfigDocGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
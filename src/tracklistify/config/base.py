@@ -3,15 +3,115 @@
 # Standard library imports
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Tuple
 
 # Local imports
 from .paths import get_root
-from .security import mask_sensitive_value
 from .validation import ConfigValidator, PathRequirement, PathRule
 
 
+_ENV_PREFIX = "TRACKLISTIFY_"
+
+
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+
+def _parse_bool(value: str, root: Path) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+def _parse_path(value: str, root: Path) -> Path:
+    # Relative paths resolve against the project root
+    path = Path(os.path.expanduser(value))
+    return path if path.is_absolute() else root / path
+
+
+def _parse_str_list(value: str, root: Path) -> List[str]:
+    # Comma-separated; blank items are dropped
+    return [s.strip() for s in value.split(",") if s.strip()]
+
+
+def _parser_for(field_type: Any) -> Callable[[str, Path], Any]:
+    """Pick the string converter for a dataclass field type."""
+    if field_type is bool:
+        return _parse_bool
+    if field_type == Path:
+        return _parse_path
+    if field_type == List[str]:
+        return _parse_str_list
+
+    def convert(value: str, root: Path) -> Any:
+        # Plain constructor call (int, float, str) - never eval()
+        try:
+            return field_type(value)
+        except ValueError as e:
+            name = getattr(field_type, "__name__", str(field_type))
+            raise ValueError(f"Expected a valid {name}.") from e
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _env_parsers(
+    config_cls: type,
+) -> Dict[str, Tuple[str, Callable[[str, Path], Any]]]:
+    """Map env var name to ``(field_name, converter)``, built once per class."""
+    return {
+        f"{_ENV_PREFIX}{name.upper()}": (name, _parser_for(f.type))
+        for name, f in config_cls.__dataclass_fields__.items()
+    }
+
+
+def _env_fingerprint(config_cls: type) -> Tuple[Tuple[str, str], ...]:
+    """Snapshot of the env vars that map to ``config_cls`` fields.
+
+    Probes the known names rather than scanning (and decoding) every
+    variable in ``os.environ``, which in CI can run to hundreds. The order
+    follows the field declaration, so the tuple is usable as a cache key.
+    """
+    env = os.environ
+    return tuple((name, env[name]) for name in _env_parsers(config_cls) if name in env)
+
+
+@lru_cache(maxsize=8)
+def _parse_env_overrides(
+    config_cls: type,
+    env_items: Tuple[Tuple[str, str], ...],
+    root: Path,
+    home: str,
+) -> Dict[str, Any]:
+    """Convert the ``TRACKLISTIFY_*`` variables to typed field values.
+
+    Memoized on the environment snapshot, the project root (which relative
+    paths resolve against) and the home directory (which ``~`` in a path
+    value expands to), so rebuilding the config with an unchanged
+    environment skips the per-field parsing.
+    """
+    # Only variables that are set and map to a field are in env_items
+    parsers = _env_parsers(config_cls)
+    overrides: Dict[str, Any] = {}
+    for env_key, env_value in env_items:
+        field_name, convert = parsers[env_key]
+
+        # Strip any comments and whitespace
+        env_value = env_value.split("#")[0].strip()
+        try:
+            overrides[field_name] = convert(env_value, root)
+        except Exception as e:
+            # Mask the value in case a user mis-pasted a secret (e.g. an API
+            # key) into a typed field. Only this error path needs security.
+            from .security import mask_sensitive_value
+
+            safe_value = mask_sensitive_value(env_key, env_value)
+            raise ValueError(
+                f"Invalid value for {env_key}: {safe_value} - {str(e)}"
+            ) from e
+
+    return overrides
+
+
 @dataclass
 class BaseConfig:
     """Base configuration class."""
@@ -44,6 +144,9 @@ class BaseConfig:
             if isinstance(directory, Path):
                 # Expand user directory (e.g., ~/)
                 directory = directory.expanduser()
+                # One stat on the common warm path instead of mkdir + EEXIST
+                if directory.is_dir():
+                    continue
                 try:
                     directory.mkdir(parents=True, exist_ok=True)
                 except Exception as e:
@@ -53,56 +156,17 @@ class BaseConfig:
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        for field_name, field_value in self.__class__.__dataclass_fields__.items():
-            env_key = f"TRACKLISTIFY_{field_name.upper()}"
-            env_value = os.getenv(env_key)
-
-            if env_value is not None:
-                # Strip any comments and whitespace
-                env_value = env_value.split("#")[0].strip()
-
-                # Convert string value to appropriate type
-                field_type: Any = field_value.type
-                value: Any
-                try:
-                    if field_type is bool:
-                        # Handle boolean values
-                        value = env_value.lower() in ("true", "1", "yes", "on")
-                    elif field_type == Path:
-                        # Handle paths - resolve relative paths relative to project root
-                        path = Path(os.path.expanduser(env_value))
-                        if not path.is_absolute():
-                            # Relative path - resolve relative to project root
-                            path = get_root() / path
-                        value = path
-                    elif field_type == List[str]:
-                        # Handle string lists (comma-separated)
-                        value = [s.strip() for s in env_value.split(",") if s.strip()]
-                    elif field_type in (int, float):
-                        # Handle numeric types
-                        try:
-                            value = field_type(env_value)
-                        except ValueError as e:
-                            # Do NOT use eval() - security vulnerability!
-                            # Mask the value in case a user mis-pasted a secret
-                            # (e.g. API key) into a numeric field.
-                            safe_value = mask_sensitive_value(env_key, env_value)
-                            raise ValueError(
-                                f"Invalid {field_type.__name__} value for "
-                                f"{env_key}: {safe_value}. "
-                                f"Expected a valid {field_type.__name__}."
-                            ) from e
-                    else:
-                        # Handle other types
-                        value = field_type(env_value)
-
-                    # Set the value on the instance
-                    setattr(self, field_name, value)
-                except Exception as e:
-                    safe_value = mask_sensitive_value(env_key, env_value)
-                    raise ValueError(
-                        f"Invalid value for {env_key}: {safe_value} - {str(e)}"
-                    ) from e
+        overrides = _parse_env_overrides(
+            self.__class__,
+            _env_fingerprint(self.__class__),
+            get_root(),
+            os.path.expanduser("~"),
+        )
+        for field_name, value in overrides.items():
+            # Copy lists so instances never share a cached mutable value
+            if isinstance(value, list):
+                value = list(value)
+            setattr(self, field_name, value)
 
     def _setup_validation(self) -> None:
         """Set up validation rules for configuration fields.
@@ -183,6 +247,13 @@ class TrackIdentificationConfig(BaseConfig):
     # bytes, which was so small the cache rejected every Shazam response.
     cache_max_size: int = field(default=1_000_000)
     cache_storage_format: str = field(default="json")
+    # Hash used to turn cache keys into filenames: "sha256" or "xxh3"
+    # (needs the xxhash package). Existing entries stay readable either way
+    # since the index records each entry's filename.
+    cache_key_hash: str = field(default="sha256")
+    # Recently read entries JSONStorage keeps in memory (as raw JSON bytes)
+    # so re-reading them skips the file read. 0 disables the tier.
+    cache_memory_entries: int = field(default=256)
     cache_compression_enabled: bool = field(default=True)
     cache_compression_level: int = field(default=6)
     # Must not be shorter than cache_ttl: these are two independent expiry
@@ -208,6 +279,12 @@ class TrackIdentificationConfig(BaseConfig):
     rate_limit_enabled: bool = field(default=True)
     max_requests_per_minute: int = field(default=25)
     max_concurrent_requests: int = field(default=2)
+    # Segments each identification worker coalesces from the queue and
+    # submits together (``IdentificationManager.identify_tracks``). 1 keeps
+    # one request per worker; raise it for providers whose limiter allows
+    # more concurrency than ``max_concurrent_requests`` (e.g. ACRCloud).
+    # Capped at the primary provider's limiter concurrency at run time.
+    provider_batch_size: int = field(default=1)
 
     # Circuit-breaker settings (consumed by RateLimiter via getattr; declared
     # here so env-var overrides land on the dataclass instance).
@@ -298,6 +375,8 @@ class TrackIdentificationConfig(BaseConfig):
         self._validator.add_range_rule("overlap_duration", 0, 30)
         self._validator.add_range_rule("min_confidence", 0.0, 1.0)
         self._validator.add_range_rule("time_threshold", 0.0, 300.0)
+        self._validator.add_range_rule("provider_batch_size", 1, 32)
+        self._validator.add_range_rule("cache_memory_entries", 0, 65536)
 
         # Add path validation rules for directories
         path_requirements = {PathRequirement.IS_DIR, PathRequirement.WRITABLE}
@@ -7,8 +7,9 @@ including markdown documentation, JSON schema, and example configurations.
 
 # Standard library imports
 from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, cast
 
 # Local/package imports
 from .validation import (
@@ -24,6 +25,24 @@ from .validation import (
 T = TypeVar("T")
 
 
+def _memoize_per_class(func: Callable[[Any], str]) -> Callable[[Any], str]:
+    """Cache a doc generator on the config class.
+
+    The generated text depends only on the class schema, so instances are
+    mapped to their class and each class is documented once.
+    """
+    cached = lru_cache(maxsize=None)(func)
+
+    @wraps(func)
+    def wrapper(config_class: Any) -> str:
+        if not isinstance(config_class, type):
+            config_class = type(config_class)
+        return cached(config_class)
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
 @dataclass
 class ConfigField:
     """Configuration field documentation."""
@@ -48,6 +67,7 @@ class ConfigDocGenerator:
         self.validator = validator
         self.dependency_rules = getattr(self.validator, "dependency_rules", [])
         self.fields: Dict[str, ConfigField] = {}
+        self._markdown: Optional[str] = None
         self._process_rules()
 
     def _process_rules(self) -> None:
@@ -170,7 +190,17 @@ class ConfigDocGenerator:
         return descriptions.get(field, f"Configuration value for {field}")
 
     def generate_markdown(self) -> str:
-        """Generate markdown documentation."""
+        """Generate markdown documentation.
+
+        The fields are fixed once the rules are processed, so the text is
+        built on first call and reused afterwards.
+        """
+        if self._markdown is None:
+            self._markdown = self._build_markdown()
+        return self._markdown
+
+    def _build_markdown(self) -> str:
+        """Render the markdown for ``generate_markdown``."""
         docs = ["# Tracklistify Configuration\n"]
         docs.append(
             "This document describes the configuration options for Tracklistify.\n"
@@ -295,6 +325,7 @@ class ConfigDocGenerator:
         return example
 
 
+@_memoize_per_class
 def generate_field_docs(config_class: Type[T]) -> str:
     """
     Generate markdown documentation for configuration fields.
@@ -321,6 +352,7 @@ def generate_field_docs(config_class: Type[T]) -> str:
     return "\n".join(docs)
 
 
+@_memoize_per_class
 def generate_env_var_docs(config_class: Type[T]) -> str:
     """
     Generate markdown documentation for environment variable overrides.
@@ -344,6 +376,7 @@ def generate_env_var_docs(config_class: Type[T]) -> str:
     return "\n".join(docs)
 
 
+@_memoize_per_class
 def generate_validation_docs(config_class: Type[T]) -> str:
     """
     Generate validation documentation for configuration.
@@ -372,6 +405,7 @@ def generate_validation_docs(config_class: Type[T]) -> str:
     return "\n".join(docs)
 
 
+@_memoize_per_class
 def generate_example_docs(config_class: Type[T]) -> str:
     """
     Generate markdown documentation with configuration examples.
@@ -408,6 +442,7 @@ def generate_example_docs(config_class: Type[T]) -> str:
     return "\n".join(docs)
 
 
+@_memoize_per_class
 def generate_full_docs(config_class: Type[T]) -> str:
     """
     Generate full documentation for a configuration class.
@@ -5,7 +5,7 @@ import threading
 from typing import Dict, Type, TypeVar, cast
 
 # Local imports
-from .base import BaseConfig, TrackIdentificationConfig
+from .base import BaseConfig, TrackIdentificationConfig, _parse_env_overrides
 
 # Import ConfigError from canonical location for re-export
 from tracklistify.core.exceptions import ConfigError
@@ -61,6 +61,7 @@ class ConfigFactory:
         """Clear all cached configuration instances."""
         with _config_lock:
             cls._instances.clear()
+            _parse_env_overrides.cache_clear()
 
 
 def get_config(force_refresh: bool = False) -> TrackIdentificationConfig:
@@ -11,7 +11,9 @@ def get_root() -> Path:
 
     Simple approach:
     1. Check environment variable TRACKLISTIFY_PROJECT_ROOT
-    2. Walk up from current file until we find pyproject.toml
+    2. Walk up from current file until we find pyproject.toml (skipped
+       when the package is zipimported — there is no directory tree to
+       walk, only stat calls that can never succeed)
     3. Fallback to current working directory
 
     Returns:
@@ -23,11 +25,19 @@ def get_root() -> Path:
         if root_path.exists():
             return root_path
 
-    # Walk up from this file to find pyproject.toml
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "pyproject.toml").exists():
-            return parent
+    # Walk up from this file to find pyproject.toml. Plain os.path string
+    # ops: this runs on the cold-start path before the CLI does anything,
+    # and a Path per ancestor is pure allocation overhead.
+    current = os.path.realpath(__file__)
+    if os.path.isfile(current):
+        parent = os.path.dirname(current)
+        while True:
+            if os.path.exists(os.path.join(parent, "pyproject.toml")):
+                return Path(parent)
+            grandparent = os.path.dirname(parent)
+            if grandparent == parent:
+                break
+            parent = grandparent
 
     # Fallback to current working directory
     return Path.cwd()
@@ -3,7 +3,9 @@ Security utilities for configuration management.
 """
 
 # Standard library imports
-from typing import Any, Dict, Set
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Set, Tuple
 
 # Local/package imports
 from tracklistify.utils.logger import get_logger
@@ -29,7 +31,12 @@ SENSITIVE_PATTERNS = [
     "proxy",
 ]
 
+# One case-insensitive alternation over SENSITIVE_PATTERNS: a single regex
+# scan per key instead of a Python-level substring test per pattern.
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_PATTERNS)), re.IGNORECASE)
 
+
+@lru_cache(maxsize=1024)
 def is_sensitive_key(key: str) -> bool:
     """Check if environment variable key is sensitive.
 
@@ -45,8 +52,7 @@ def is_sensitive_key(key: str) -> bool:
         >>> is_sensitive_key("TRACKLISTIFY_DEBUG")
         False
     """
-    key_lower = key.lower()
-    return any(pattern in key_lower for pattern in SENSITIVE_PATTERNS)
+    return _SENSITIVE_RE.search(key) is not None
 
 
 def mask_sensitive_value(key: str, value: str) -> str:
@@ -97,7 +103,7 @@ def is_sensitive_field(field_name: str) -> bool:
 
 def detect_sensitive_fields(data: Dict[str, Any], parent_key: str = "") -> Set[str]:
     """
-    Recursively detect sensitive fields in a dictionary.
+    Detect sensitive fields in a dictionary, including nested dictionaries.
 
     Args:
         data: Dictionary to scan
@@ -107,17 +113,22 @@ def detect_sensitive_fields(data: Dict[str, Any], parent_key: str = "") -> Set[s
         Set of sensitive field names
     """
     sensitive_fields = set()
-
-    for key, value in data.items():
-        current_key = f"{parent_key}.{key}" if parent_key else key
-
-        # Check if the current field is sensitive
-        if is_sensitive_field(key):
-            sensitive_fields.add(current_key)
-
-        # Recursively check nested dictionaries
-        if isinstance(value, dict):
-            sensitive_fields.update(detect_sensitive_fields(value, current_key))
+    # Prefixes are kept as key tuples; the dotted name is only joined for
+    # the (rare) sensitive hits, not for every node visited.
+    stack: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = [
+        ((parent_key,) if parent_key else (), data)
+    ]
+
+    while stack:
+        prefix, mapping = stack.pop()
+        for key, value in mapping.items():
+            # Check if the current field is sensitive
+            if is_sensitive_field(key):
+                sensitive_fields.add(".".join(map(str, (*prefix, key))))
+
+            # Queue nested dictionaries instead of recursing
+            if isinstance(value, dict):
+                stack.append(((*prefix, key), value))
 
     return sensitive_fields
 
@@ -135,12 +146,22 @@ def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
 
+    # Walk nested dicts with an explicit stack, filling each output level in
+    # place; the helpers are bound to locals for the inner loop.
+    is_sensitive = is_sensitive_field
+    mask_value = mask_sensitive_value
     masked: Dict[str, Any] = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            masked[key] = mask_sensitive_data(value)
-        elif isinstance(value, str) and is_sensitive_field(key):
-            masked[key] = mask_sensitive_value(key, value)
-        else:
-            masked[key] = value
+    stack = [(data, masked)]
+
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                nested: Dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif isinstance(value, str) and is_sensitive(key):
+                target[key] = mask_value(key, value)
+            else:
+                target[key] = value
     return masked
@@ -6,7 +6,9 @@ including type checking, range validation, dependency validation, and path valid
 """
 
 # Standard library imports
+import os
 import re
+import stat
 from dataclasses import fields
 from enum import Enum
 from pathlib import Path
@@ -32,6 +34,14 @@ class ConfigValidationError(ValidationError):
         super().__init__(f"{field}: {message}")
 
 
+class MultipleValidationError(ValidationError):
+    """Raised when more than one configuration rule fails."""
+
+    def __init__(self, errors: List[ValidationError]):
+        self.errors = errors
+        super().__init__("; ".join(str(e) for e in errors))
+
+
 class DependencyError(ValidationError):
     """Raised when configuration dependencies are not satisfied."""
 
@@ -140,6 +150,18 @@ class RangeRule(ValidationRule):
         if value is None:
             return
 
+        # Fast path: inclusive bounds (every rule the configs register) and an
+        # in-range value settle in one chained comparison.
+        min_value, max_value = self.min_value, self.max_value
+        if (
+            self.include_min
+            and self.include_max
+            and min_value is not None
+            and max_value is not None
+            and min_value <= value <= max_value
+        ):
+            return
+
         if self.min_value is not None:
             if self.include_min and value < self.min_value:
                 raise RangeValidationError(
@@ -237,21 +259,31 @@ class PathRule(ValidationRule):
         if PathRequirement.IS_ABSOLUTE in self.requirements and not path.is_absolute():
             raise PathValidationError(f"{self.field}: Path must be absolute")
 
+        # One stat up front answers exists/is_dir/is_file; directories are
+        # only created (and re-stat'ed) when actually missing.
+        st = _stat_or_none(path)
+
         # Handle directory creation before existence checks
-        if self.create_if_missing and PathRequirement.IS_DIR in self.requirements:
+        if (
+            st is None
+            and self.create_if_missing
+            and PathRequirement.IS_DIR in self.requirements
+        ):
             try:
                 path.mkdir(parents=True, exist_ok=True)
             except Exception as e:
                 raise PathValidationError(
                     f"{self.field}: Failed to create directory: {e}"
                 ) from e
+            st = _stat_or_none(path)
 
-        if PathRequirement.EXISTS in self.requirements and not path.exists():
+        if PathRequirement.EXISTS in self.requirements and st is None:
             if self.create_if_missing:
                 try:
                     if PathRequirement.IS_DIR not in self.requirements:
                         path.parent.mkdir(parents=True, exist_ok=True)
                         path.touch()
+                        st = _stat_or_none(path)
                 except Exception as e:
                     raise PathValidationError(
                         f"{self.field}: Failed to create path: {e}"
@@ -259,15 +291,18 @@ class PathRule(ValidationRule):
             else:
                 raise PathValidationError(f"{self.field}: Path does not exist")
 
-        if PathRequirement.IS_FILE in self.requirements and not path.is_file():
+        is_file = st is not None and stat.S_ISREG(st.st_mode)
+        is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+
+        if PathRequirement.IS_FILE in self.requirements and not is_file:
             raise PathValidationError(f"{self.field}: Path must be a file")
 
-        if PathRequirement.IS_DIR in self.requirements and not path.is_dir():
+        if PathRequirement.IS_DIR in self.requirements and not is_dir:
             raise PathValidationError(f"{self.field}: Path must be a directory")
 
         if PathRequirement.READABLE in self.requirements:
             try:
-                if path.is_file():
+                if is_file:
                     with open(path, "r"):
                         pass
             except Exception as e:
@@ -277,12 +312,13 @@ class PathRule(ValidationRule):
 
         if PathRequirement.WRITABLE in self.requirements:
             try:
-                if path.is_file():
+                if is_file:
                     with open(path, "a"):
                         pass
                 else:
                     # Create directory if it doesn't exist
-                    path.mkdir(parents=True, exist_ok=True)
+                    if not is_dir:
+                        path.mkdir(parents=True, exist_ok=True)
                     # Test writability with a temporary file
                     test_file = path / ".write_test"
                     test_file.touch()
@@ -293,6 +329,14 @@ class PathRule(ValidationRule):
                 ) from e
 
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """``os.stat`` the path, or None if it is missing or inaccessible."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 class DependencyRule(ValidationRule):
     """Rule for dependency validation."""
 
@@ -401,16 +445,33 @@ class ConfigValidator:
         Args:
             config: Configuration dictionary to validate
 
+        Every field and dependency rule is checked so that all problems are
+        reported at once. A single failure is raised unchanged; several are
+        combined into a MultipleValidationError.
+
         Raises:
             ValidationError: If validation fails
         """
-        # Validate individual fields
+        errors: List[ValidationError] = []
+
+        # Validate individual fields (first failing rule per field)
         for field, value in config.items():
-            self.validate_field(field, value)
+            try:
+                self.validate_field(field, value)
+            except ValidationError as e:
+                errors.append(e)
 
         # Validate dependencies
         for rule in self.dependency_rules:
-            rule.validate(config)
+            try:
+                rule.validate(config)
+            except ValidationError as e:
+                errors.append(e)
+
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise MultipleValidationError(errors)
 
     def validate_field(self, field: str, value: Any) -> None:
         """
@@ -476,10 +537,12 @@ def validate_path(
         raise ValueError(f"{field_name}: Path cannot be empty")
 
     try:
-        path = Path(value).resolve()
-        if must_exist and not path.exists():
+        # os.path works on the string directly; build the Path only once,
+        # for the return value (Path.resolve() is realpath plus wrapping).
+        path = os.path.realpath(value)
+        if must_exist and not os.path.exists(path):
             raise ValueError(f"{field_name}: Path does not exist: {path}")
-        return path
+        return Path(path)
     except Exception as e:
         raise ValueError(f"{field_name}: Invalid path: {e}") from e
 
@@ -499,10 +562,14 @@ def validate_positive_float(value: float, field_name: str) -> float:
         TypeError: If value is not a float
         ValueError: If value is not positive
     """
-    if not isinstance(value, (int, float)):
-        raise TypeError(f"{field_name} must be a number, got {type(value).__name__}")
+    # Exact floats (the common case) skip the isinstance/float() round-trip
+    if type(value) is not float:
+        if not isinstance(value, (int, float)):
+            raise TypeError(
+                f"{field_name} must be a number, got {type(value).__name__}"
+            )
+        value = float(value)
 
-    value = float(value)
     if value <= 0:
         raise ValueError(f"{field_name} must be positive, got {value}")
 
@@ -524,7 +591,11 @@ def validate_positive_int(value: int, field_name: str) -> int:
         TypeError: If value is not an integer
         ValueError: If value is not positive
     """
-    if not isinstance(value, int) or isinstance(value, bool):
+    # Exact ints (the common case) pass with one type() check; bool is an int
+    # subclass and is rejected on the slow path
+    if type(value) is not int and (
+        not isinstance(value, int) or isinstance(value, bool)
+    ):
         raise TypeError(f"{field_name} must be an integer, got {type(value).__name__}")
 
     if value <= 0:
@@ -548,10 +619,13 @@ def validate_probability(value: float, field_name: str) -> float:
         TypeError: If value is not a float
         ValueError: If value is not between 0 and 1
     """
-    if not isinstance(value, (int, float)):
-        raise TypeError(f"{field_name} must be a number, got {type(value).__name__}")
+    if type(value) is not float:
+        if not isinstance(value, (int, float)):
+            raise TypeError(
+                f"{field_name} must be a number, got {type(value).__name__}"
+            )
+        value = float(value)
 
-    value = float(value)
     if not 0 <= value <= 1:
         raise ValueError(f"{field_name} must be between 0 and 1, got {value}")
 
@@ -575,7 +649,11 @@ def validate_string_list(value: List[str], field_name: str) -> List[str]:
     if not isinstance(value, list):
         raise TypeError(f"{field_name} must be a list")
 
-    if not all(isinstance(item, str) for item in value):
+    # Collect the item types in C first; only lists holding something other
+    # than exact ``str`` need the per-item isinstance check (str subclasses).
+    if set(map(type, value)) - {str} and not all(
+        isinstance(item, str) for item in value
+    ):
         raise TypeError(f"{field_name} must contain only strings")
 
     return value
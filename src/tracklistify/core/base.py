@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import subprocess
+import threading
 import traceback
 import uuid
 from datetime import datetime
@@ -345,7 +346,7 @@ class AsyncApp:
             # from yt-dlp (or local-file fallback below) so split_audio
             # doesn't have to re-probe — mutagen doesn't read every
             # container we now allow under --stream-copy (e.g. .webm).
-            audio_segments = self.split_audio(
+            audio_segments = await self._split_audio_in_thread(
                 local_path, duration_hint=getattr(self, "duration", 0) or None
             )
             if not audio_segments:
@@ -371,7 +372,7 @@ class AsyncApp:
                 )
 
             self.logger.info(f"Identified {len(tracks)} tracks")
-            self.logger.debug(f"Tracks: {tracks}")
+            self.logger.debug("Tracks: %s", tracks)
 
             # Only save if we have identified tracks
             self.logger.info("Saving output...")
@@ -395,8 +396,36 @@ class AsyncApp:
             # Always clean up temporary files
             await self.cleanup()
 
-    def split_audio(
+    async def _split_audio_in_thread(
         self, file_path: str, duration_hint: Optional[float] = None
+    ) -> List[AudioSegment]:
+        """Run ``split_audio`` in a worker thread, honouring cancellation.
+
+        split_audio blocks (mutagen probe + waiting on its ffmpeg pool), so
+        it runs off the event loop. Cancelling the await can't stop a
+        thread, though: on cancellation we set ``stop`` so no further ffmpeg
+        process is started, then wait for the thread to return before
+        re-raising. Otherwise ``process_input``'s ``finally: cleanup()``
+        would remove ``temp_dir`` while ffmpeg is still writing into it.
+        """
+        stop = threading.Event()
+        split = asyncio.ensure_future(
+            asyncio.to_thread(
+                self.split_audio, file_path, duration_hint=duration_hint, stop=stop
+            )
+        )
+        try:
+            return await asyncio.shield(split)
+        except asyncio.CancelledError:
+            stop.set()
+            await asyncio.wait({split})
+            raise
+
+    def split_audio(
+        self,
+        file_path: str,
+        duration_hint: Optional[float] = None,
+        stop: Optional[threading.Event] = None,
     ) -> List[AudioSegment]:
         """Split audio file into overlapping segments for analysis.
 
@@ -407,6 +436,9 @@ class AsyncApp:
                 container — e.g. ``.webm`` returned by yt-dlp under
                 ``--stream-copy``). Mutagen is used only when no hint is
                 available (local-file path with no upstream metadata).
+            stop: Set from another thread to abandon the split: pending
+                segments are cancelled and no new ffmpeg process starts.
+                Segments already being cut finish (bounded by their timeout).
         """
         self.logger.info(f"Splitting audio file: {file_path}")
         self.logger.debug(
@@ -510,6 +542,8 @@ class AsyncApp:
 
         def create_segment(params):
             """Create a single audio segment using ffmpeg."""
+            if stop is not None and stop.is_set():
+                return None
             try:
                 if params["file"].exists():
                     # Skip if file already exists and has content
@@ -527,7 +561,7 @@ class AsyncApp:
                     check=True,
                     timeout=FFMPEG_SEGMENT_TIMEOUT,
                 )
-                self.logger.debug(f"FFmpeg output: {result.stdout}")
+                self.logger.debug("FFmpeg output: %s", result.stdout)
 
                 if params["file"].exists() and params["file"].stat().st_size > 1000:
                     return AudioSegment(
@@ -586,6 +620,11 @@ class AsyncApp:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = [executor.submit(create_segment, p) for p in segment_params]
                 for fut in concurrent.futures.as_completed(futures):
+                    if stop is not None and stop.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        self.logger.info("Splitting cancelled")
+                        return []
                     result = fut.result()
                     if result is not None:
                         segments.append(result)
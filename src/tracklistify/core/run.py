@@ -1,20 +1,24 @@
 """Main entry point for Tracklistify."""
 
 import asyncio
+import shutil
 import signal
 import sys
 
 from tracklistify.config import get_root
+from tracklistify.utils.event_loop import run_async
 
 
 def setup_environment():
     """Setup the Python path and environment variables."""
-    env_path = get_root() / ".env"
-    if not env_path.exists() and (get_root() / ".env.example").exists():
+    root = get_root()
+    env_path = root / ".env"
+    example_path = root / ".env.example"
+    if not env_path.exists() and example_path.exists():
         print("Creating .env from .env.example...")
-        with open(get_root() / ".env.example") as f:
-            with open(env_path, "w") as env:
-                env.write(f.read())
+        # copyfile uses the kernel's zero-copy path (sendfile /
+        # copy_file_range) where available instead of a read-all/write-all.
+        shutil.copyfile(example_path, env_path)
         print("Please edit .env with your credentials")
         sys.exit(1)
 
@@ -40,19 +44,6 @@ def check_dependencies():
         print("\nIf ffmpeg is already installed, ensure it's in your system PATH")
         sys.exit(1)
 
-    # Additional verification by trying to run ffmpeg
-    try:
-        import subprocess
-
-        subprocess.run([ffmpeg_path, "-version"], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        print(f"Error: Found ffmpeg at {ffmpeg_path} but unable to execute it")
-        print("Please check if you have the necessary permissions")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error verifying ffmpeg: {e}")
-        sys.exit(1)
-
 
 def handle_interrupt(signum, frame):
     """Handle interrupt signal (Ctrl+C) gracefully."""
@@ -121,7 +112,7 @@ def main():
 
     try:
         # Run the async main with proper cleanup
-        return asyncio.run(amain())
+        return run_async(amain())
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
         return 0
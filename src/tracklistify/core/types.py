@@ -57,6 +57,8 @@ class TrackIdentificationConfigDict(TypedDict):
     cache_ttl: int
     cache_max_size: int
     cache_storage_format: str
+    cache_key_hash: str
+    cache_memory_entries: int
     cache_compression_enabled: bool
     cache_compression_level: int
     cache_max_age: int
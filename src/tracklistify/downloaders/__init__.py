@@ -1,9 +1,20 @@
 """
 Audio download functionality.
+
+``YtDlpDownloader`` is loaded lazily via PEP 562 ``__getattr__`` so that
+importing the package (e.g. for ``cache_key`` or ``DownloaderFactory``) does
+not import ``yt_dlp`` until a URL actually needs downloading.
 """
 
 from .base import Downloader
 from .factory import DownloaderFactory
-from .ytdlp import YtDlpDownloader
 
 __all__ = ["Downloader", "DownloaderFactory", "YtDlpDownloader"]
+
+
+def __getattr__(name: str):
+    if name == "YtDlpDownloader":
+        from .ytdlp import YtDlpDownloader
+
+        return YtDlpDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,8 +15,6 @@ from tracklistify.utils.validation import (
 )
 
 from .base import Downloader
-from .mixcloud import MixcloudDownloader
-from .ytdlp import YtDlpDownloader
 
 logger = get_logger(__name__)
 
@@ -48,11 +46,14 @@ class DownloaderFactory:
         """
         logger.debug(f"Creating downloader for URL: {url}")
 
-        if is_youtube_url(url):
-            logger.debug("URL identified as YouTube")
-            return YtDlpDownloader(**kwargs)
-        if is_soundcloud_url(url):
-            logger.debug("URL identified as Soundcloud")
+        # Imported here: both pull in yt_dlp (~0.2s), which local-file runs
+        # and the CLI's argument handling never need.
+        from .mixcloud import MixcloudDownloader
+        from .ytdlp import YtDlpDownloader
+
+        # YouTube and Soundcloud share the generic yt-dlp downloader
+        if is_youtube_url(url) or is_soundcloud_url(url):
+            logger.debug("URL identified as YouTube/Soundcloud")
             return YtDlpDownloader(**kwargs)
         elif is_mixcloud_url(url):
             logger.debug("URL identified as Mixcloud")
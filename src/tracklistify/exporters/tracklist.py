@@ -19,12 +19,23 @@ from tracklistify.utils.logger import get_logger
 _INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*@]')
 _MULTISPACE_RE = re.compile(r"\s+")
 
+# Markdown/M3U are written line by line; a 64 KiB buffer (vs the 8 KiB
+# default) turns a long tracklist into a handful of write() syscalls.
+_WRITE_BUFFER_SIZE = 1 << 16
+
 logger = get_logger(__name__)
 
 
 class TracklistOutput:
     """Handles tracklist output in various formats."""
 
+    # Format name -> writer method name; order is the save_all order.
+    FORMATS: Dict[str, str] = {
+        "json": "_save_json",
+        "markdown": "_save_markdown",
+        "m3u": "_save_m3u",
+    }
+
     def __init__(self, mix_info: dict, tracks: List[Track]):
         """
         Initialize with mix information and tracks.
@@ -111,15 +122,11 @@ class TracklistOutput:
         Returns:
             Path to saved file, or None if format is invalid
         """
-        if format_type == "json":
-            return self._save_json()
-        elif format_type == "markdown":
-            return self._save_markdown()
-        elif format_type == "m3u":
-            return self._save_m3u()
-        else:
+        writer = self.FORMATS.get(format_type)
+        if writer is None:
             logger.error(f"Invalid format type: {format_type}")
             return None
+        return getattr(self, writer)()
 
     def _save_json(self) -> Path:
         """Save tracks as JSON file."""
@@ -199,7 +206,9 @@ class TracklistOutput:
         """Save tracks as Markdown file."""
         output_file = self.output_dir / self._format_filename("md")
 
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(
+            output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
             # Write header
             f.write(f"# {self.mix_info.get('title', 'Unknown Mix')}\n\n")
 
@@ -238,7 +247,9 @@ class TracklistOutput:
         # Precompute start offsets; time_in_mix is "H+:MM:SS" (hours unbounded).
         starts = [self._time_in_mix_to_seconds(t.time_in_mix) for t in self.tracks]
 
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(
+            output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
             f.write("#EXTM3U\n")
 
             for i, track in enumerate(self.tracks):
@@ -288,11 +299,10 @@ class TracklistOutput:
         Returns:
             List of paths to saved files
         """
-        formats = ["json", "markdown", "m3u"]
         saved_files = []
 
         try:
-            for format_type in formats:
+            for format_type in self.FORMATS:
                 try:
                     if path := self.save(format_type):
                         saved_files.append(path)
@@ -105,7 +105,7 @@ class ShazamProvider(TrackIdentificationProvider):
             # noise at default verbosity (74 segments -> 74 lines saying
             # nothing). Progress is reported by ProgressDisplay; outcomes by
             # add_track.
-            logger.debug(f"Identifying segment at {audio_segment.start_time}s")
+            logger.debug("Identifying segment at %ss", audio_segment.start_time)
 
             # Ensure the audio file path is valid
             if not hasattr(audio_segment, "file_path") or not audio_segment.file_path:
@@ -115,7 +115,7 @@ class ShazamProvider(TrackIdentificationProvider):
             # Perform track recognition using the updated method
             proxy = self._config.shazam_proxy or None
             result = await self.shazam.recognize(audio_segment.file_path, proxy=proxy)
-            logger.debug(f"Shazam response: {result}")
+            logger.debug("Shazam response: %s", result)
 
             # An unmatched segment is the NORMAL case, not a fault: a DJ mix
             # is full of unreleased IDs, mashups and long transitions that
@@ -2,9 +2,12 @@
 _summary_
 
 This module contains utility functions for the tracklistify package.
+
+``IdentificationManager`` is loaded lazily via PEP 562 ``__getattr__``: it
+pulls in the cache, config and provider stacks, and importing
+``tracklistify.utils.logger`` (which every module does) should not.
 """
 
-from .identification import IdentificationManager
 from .logger import get_logger, set_logger
 from .validation import validate_input
 
@@ -14,3 +17,11 @@ __all__ = [
     "validate_input",
     "IdentificationManager",
 ]
+
+
+def __getattr__(name: str):
+    if name == "IdentificationManager":
+        from .identification import IdentificationManager
+
+        return IdentificationManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
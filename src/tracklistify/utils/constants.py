@@ -25,8 +25,8 @@ FFMPEG_TRANSCODE_TIMEOUT = 300  # seconds; full-file transcode cutoff
 
 # Cache defaults
 DEFAULT_CACHE_TTL = 3600  # 1 hour
-# Bytes, not entries: SizeStrategy measures len(json.dumps(value)) per entry,
-# and BaseCache treats max_size as a byte budget. 1_000_000 ≈ 1 MB.
+# Bytes, not entries: SizeStrategy compares the serialized size storage records
+# per entry, and BaseCache treats max_size as a byte budget. 1_000_000 ≈ 1 MB.
 DEFAULT_CACHE_MAX_SIZE = 1_000_000
 
 # Rate limiter defaults
@@ -0,0 +1,42 @@
+"""
+Event loop selection for the asyncio entry points.
+"""
+
+# Standard library imports
+import asyncio
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+# Local/package imports
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's loop constructor when uvloop is installed.
+
+    uvloop is an optional accelerator, not a dependency: the pipeline is
+    I/O-bound (provider HTTP, ffmpeg subprocesses, cache files) and runs on
+    libuv's loop unchanged. Absent (or on Windows, where it doesn't build)
+    None is returned and the stdlib loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion, on uvloop when it is installed.
+
+    A drop-in for ``asyncio.run``. The loop is handed to ``asyncio.Runner``
+    as a factory, so the process-wide event loop policy is left untouched.
+    """
+    loop_factory = uvloop_factory()
+    if loop_factory is not None:
+        logger.debug("Using uvloop event loop")
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
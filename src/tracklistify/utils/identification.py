@@ -8,7 +8,7 @@ import contextlib
 import hashlib
 import sys
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, cast
 
 from tracklistify.cache.factory import get_cache
 from tracklistify.config.factory import get_config
@@ -910,7 +910,7 @@ class IdentificationManager:
                 md[key] = result[key]
         track.metadata["beatport_match"] = match_kind
 
-    async def identify_tracks(self, audio_segments):
+    async def identify_tracks(self, audio_segments: Iterable[Any]) -> List[Track]:
         provider_names = self._provider_chain()
 
         # Instantiate providers up front. A broken PRIMARY is fatal (raise,
@@ -926,7 +926,6 @@ class IdentificationManager:
                     raise
                 logger.warning(f"Skipping unusable fallback provider {name!r}: {e}")
 
-        identified_tracks = []
         limiter = get_global_rate_limiter()
 
         # Enter every provider's async context so aiohttp/shazamio
@@ -935,78 +934,66 @@ class IdentificationManager:
             for _, provider in chain:
                 await stack.enter_async_context(provider)
 
-            for segment in audio_segments:
-                track = None
-                for provider_name, provider in chain:
-                    # Cache lookup (best-effort, content-addressed by segment
-                    # bytes + provider — temp paths are per-run). A hit
-                    # short-circuits both the rate limiter and the network.
-                    #
-                    # ``refresh_cache`` (--no-cache) skips the READ but
-                    # keeps the key so the write below still fires. Skipping
-                    # both would make the flag a one-run bypass: the stale
-                    # entry would survive on disk and be served again on the
-                    # next normal run, which is the opposite of what someone
-                    # chasing a wrong identification wants.
-                    cache_key = self._cache_key(provider_name, segment)
-                    if cache_key is not None and not self._refresh_cache:
-                        try:
-                            cached = await self._cache.get(cache_key)
-                        except Exception as e:
-                            logger.debug(f"Cache get failed: {e}")
-                            cached = None
-                        if cached is not None:
-                            track = self._track_from_info(cached, segment)
-                            if track is not None:
-                                # Mark the hit: this path never touches the
-                                # provider, so without a line here a cached
-                                # segment is indistinguishable from one that
-                                # was never processed. That reads as a gap
-                                # in the segment sequence (e.g. 200s jumping
-                                # to 350s) and looks like dropped work.
-                                logger.debug(
-                                    f"Cache hit for segment at "
-                                    f"{segment.start_time}s ({provider_name})"
-                                )
-                                break
-
-                    acquired = False
-                    try:
-                        acquired = await limiter.acquire(provider_name)
-                        if not acquired:
-                            logger.warning(
-                                f"Rate limiter rejected request for "
-                                f"{provider_name}; trying next provider"
-                            )
-                            continue
-                        track_info = await provider.identify_track(segment)
-                        limiter.record_result(provider_name, success=True)
-                        track = self._track_from_info(track_info, segment)
-                        if track is not None:
-                            # Best-effort cache of the raw provider response.
-                            # Failures degrade to live-only; never abort.
-                            if cache_key is not None:
-                                try:
-                                    await self._cache.set(cache_key, track_info)
-                                except Exception as e:
-                                    logger.debug(f"Cache set failed: {e}")
-                            break
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        limiter.record_result(provider_name, success=False)
-                        logger.error(
-                            f"{provider_name} identification failed for "
-                            f"segment at {segment.start_time}s: {e}"
-                        )
-                        continue
-                    finally:
-                        if acquired:
-                            limiter.release(provider_name)
-
+            # Producer/consumer pipeline: the producer feeds segments into a
+            # bounded queue and ``max_concurrent_requests`` workers identify
+            # them, so one slow provider round trip no longer holds up the
+            # segments behind it. At most ``workers * batch_size`` segments
+            # are in flight — never one pending task per segment of a long
+            # mix, which would all queue on the limiter and time out in
+            # ``acquire`` (a timed-out segment is logged and dropped).
+            # ``batch_size`` is ``provider_batch_size`` capped at what the
+            # primary provider's limiter lets through at once: batching
+            # beyond that only adds waiters, so under a serial limiter
+            # (Shazam) each worker stays at one request.
+            # ``TaskGroup`` cancels the rest if anything (Ctrl+C included)
+            # escapes a worker. Matches are keyed by segment index so
+            # ``identified_tracks`` keeps segment order.
+            workers = max(1, self.config.max_concurrent_requests)
+            batch_size = max(1, self.config.provider_batch_size)
+            if chain:
+                batch_size = min(batch_size, limiter.max_concurrent(chain[0][0]))
+            # Deep enough for every worker to coalesce a full batch.
+            queue: asyncio.Queue = asyncio.Queue(maxsize=workers * max(2, batch_size))
+            matches: Dict[int, Track] = {}
+            total = 0
+
+            async def produce():
+                nonlocal total
+                for index, segment in enumerate(audio_segments):
+                    await queue.put((index, segment))
+                    total += 1
+                for _ in range(workers):
+                    await queue.put(None)
+
+            async def identify_one(index, segment):
+                track = await self._identify_segment(chain, limiter, segment)
                 if track is not None:
                     self.track_matcher.add_track(track)
-                    identified_tracks.append(track)
+                    matches[index] = track
+
+            async def work():
+                # Async batching: block for one segment, then coalesce
+                # whatever else is already queued (up to ``batch_size``) and
+                # submit it together instead of one round trip at a time.
+                done = False
+                while not done:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    batch = [item]
+                    while len(batch) < batch_size and not queue.empty():
+                        item = queue.get_nowait()
+                        if item is None:
+                            done = True
+                            break
+                        batch.append(item)
+                    await asyncio.gather(*(identify_one(i, s) for i, s in batch))
+
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                for _ in range(workers):
+                    tg.create_task(work())
+            identified_tracks = [matches[i] for i in sorted(matches)]
 
         # Get unique tracks sorted by time in mix
         unique_tracks = self.track_matcher.get_unique_tracks()
@@ -1032,7 +1019,6 @@ class IdentificationManager:
         # geo-blocked endpoint or an expired signature scheme produces a
         # clean "0 tracks" run with nothing above debug to explain it.
         # Scattered misses are normal; a near-total miss rate is a signal.
-        total = len(audio_segments)
         if total >= _MIN_SEGMENTS_FOR_MISS_RATE_WARNING and not identified_tracks:
             logger.warning(
                 f"No segment out of {total} produced a match. That is "
@@ -1043,6 +1029,83 @@ class IdentificationManager:
             )
         return unique_tracks
 
+    async def _identify_segment(self, chain, limiter, segment) -> Optional[Track]:
+        """Walk the provider chain for one segment; return the first match.
+
+        Each provider is tried in order — cache first, then the live call
+        under the rate limiter — until one yields a valid ``Track``. Provider
+        errors fall through to the next provider; only cancellation escapes.
+        """
+        track = None
+        for provider_name, provider in chain:
+            # Cache lookup (best-effort, content-addressed by segment
+            # bytes + provider — temp paths are per-run). A hit
+            # short-circuits both the rate limiter and the network.
+            #
+            # ``refresh_cache`` (--no-cache) skips the READ but
+            # keeps the key so the write below still fires. Skipping
+            # both would make the flag a one-run bypass: the stale
+            # entry would survive on disk and be served again on the
+            # next normal run, which is the opposite of what someone
+            # chasing a wrong identification wants.
+            cache_key = self._cache_key(provider_name, segment)
+            if cache_key is not None and not self._refresh_cache:
+                try:
+                    cached = await self._cache.get(cache_key)
+                except Exception as e:
+                    logger.debug(f"Cache get failed: {e}")
+                    cached = None
+                if cached is not None:
+                    track = self._track_from_info(cached, segment)
+                    if track is not None:
+                        # Mark the hit: this path never touches the
+                        # provider, so without a line here a cached
+                        # segment is indistinguishable from one that
+                        # was never processed. That reads as a gap
+                        # in the segment sequence (e.g. 200s jumping
+                        # to 350s) and looks like dropped work.
+                        logger.debug(
+                            "Cache hit for segment at %ss (%s)",
+                            segment.start_time,
+                            provider_name,
+                        )
+                        break
+
+            acquired = False
+            try:
+                acquired = await limiter.acquire(provider_name)
+                if not acquired:
+                    logger.warning(
+                        f"Rate limiter rejected request for "
+                        f"{provider_name}; trying next provider"
+                    )
+                    continue
+                track_info = await provider.identify_track(segment)
+                limiter.record_result(provider_name, success=True)
+                track = self._track_from_info(track_info, segment)
+                if track is not None:
+                    # Best-effort cache of the raw provider response.
+                    # Failures degrade to live-only; never abort.
+                    if cache_key is not None:
+                        try:
+                            await self._cache.set(cache_key, track_info)
+                        except Exception as e:
+                            logger.debug(f"Cache set failed: {e}")
+                    break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                limiter.record_result(provider_name, success=False)
+                logger.error(
+                    f"{provider_name} identification failed for "
+                    f"segment at {segment.start_time}s: {e}"
+                )
+                continue
+            finally:
+                if acquired:
+                    limiter.release(provider_name)
+        return track
+
     def _cache_key(self, provider_name: str, segment) -> Optional[str]:
         """Build a content-addressed cache key, or None to skip caching.
 
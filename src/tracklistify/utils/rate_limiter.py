@@ -324,6 +324,12 @@ class RateLimiter:
                     f"after {limits.consecutive_failures} failures"
                 )
 
+    def max_concurrent(self, provider: Any) -> int:
+        """Return how many requests ``provider`` may have in flight."""
+        if provider not in self._provider_limits:
+            self.register_provider(provider)
+        return self._provider_limits[provider].max_concurrent_requests
+
     def get_metrics(self, provider: Any) -> Dict[str, Any]:
         """Get metrics for a provider."""
         if provider not in self._provider_limits:
@@ -3,6 +3,7 @@ Input validation utilities for Tracklistify.
 """
 
 # Standard library imports
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional, Tuple
 from urllib.parse import urlparse
@@ -104,18 +105,31 @@ def _is_platform_url(url: str, allowed_domains: Iterable[str]) -> bool:
     (e.g. "m.youtube.com" for "youtube.com"); subdomain logic is delegated
     to ``_is_domain_or_subdomain``.
     """
-    if not url:
+    # Non-str input (bytes, None, ...) never matched: urlparse would have
+    # returned a bytes scheme or raised
+    if not url or not isinstance(url, str):
+        return False
+    host = _http_hostname(url)
+    if not host:
         return False
+    return any(_is_domain_or_subdomain(host, d) for d in allowed_domains)
+
+
+@lru_cache(maxsize=256)
+def _http_hostname(url: str) -> str:
+    """Hostname of an ``http``/``https`` URL, or ``""`` for anything else.
+
+    Memoized because one input URL is classified several times per run
+    (downloader factory, download-cache key, yt-dlp downloader), each
+    probing up to three platforms.
+    """
     try:
         parsed = urlparse(url)
     except Exception:
-        return False
+        return ""
     if parsed.scheme.lower() not in {"http", "https"}:
-        return False
-    host = parsed.hostname
-    if not host:
-        return False
-    return any(_is_domain_or_subdomain(host, d) for d in allowed_domains)
+        return ""
+    return parsed.hostname or ""
 
 
 def is_youtube_url(url: str) -> bool:
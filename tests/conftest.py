@@ -2,6 +2,8 @@
 
 import pytest
 import os
+import subprocess
+import sys
 from tracklistify.config import TrackIdentificationConfig
 
 
@@ -72,3 +74,26 @@ def sample_audio_file(tmp_path):
         + b"\x00" * 1000  # Data
     )
     return audio_file
+
+
+def _modules_loaded_after(import_stmt, names):
+    """Run ``import_stmt`` in a fresh interpreter and return which of
+    ``names`` it left in ``sys.modules``.
+
+    The test process already has everything imported, so checking
+    ``sys.modules`` here proves nothing about what an import pulls in.
+    """
+    code = (
+        f"import sys\n{import_stmt}\n"
+        f"print(' '.join(m for m in {list(names)!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+@pytest.fixture
+def modules_loaded_after():
+    """``_modules_loaded_after`` for import-deferral tests."""
+    return _modules_loaded_after
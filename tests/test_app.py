@@ -1,7 +1,9 @@
 import asyncio
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 import subprocess
 
@@ -132,12 +134,10 @@ class TestAppSaveOutput:
     @pytest.mark.asyncio
     async def test_save_output_incomplete_track_info(self, app):
         """Test saving output when track lacks artist/song info."""
-        # Create a mock track that returns None for artist and song_name
-        mock_track = Mock(spec=Track)
-        mock_track.artist = None
-        mock_track.song_name = None
-        mock_track.time_in_mix = "00:00:00"
-        mock_track.confidence = 90.0
+        # Plain stub track with no artist/song_name (no Mock spec introspection)
+        mock_track = SimpleNamespace(
+            artist=None, song_name=None, time_in_mix="00:00:00", confidence=90.0
+        )
 
         tracks = [mock_track]
 
@@ -504,6 +504,96 @@ class TestAppProcessInput:
         app.save_output.assert_called_once()
         assert app.original_title == "test"
 
+    @pytest.mark.asyncio
+    async def test_split_audio_runs_off_event_loop(self, app, temp_dir, monkeypatch):
+        """Segmentation blocks on ffmpeg, so it must not run on the loop thread."""
+        import threading
+
+        test_file = temp_dir / "test.mp3"
+        test_file.write_text("mock audio content")
+        monkeypatch.setattr(
+            "tracklistify.core.base.validate_input", lambda p: (p, True)
+        )
+
+        loop_thread = threading.current_thread()
+        split_threads = []
+
+        def fake_split(path, duration_hint=None, stop=None):
+            split_threads.append(threading.current_thread())
+            return ["segment1"]
+
+        app.split_audio = fake_split
+        app.identification_manager.identify_tracks = AsyncMock(
+            return_value=[
+                Track(
+                    song_name="Test Song",
+                    artist="Test Artist",
+                    time_in_mix="00:00:00",
+                    confidence=90.0,
+                )
+            ]
+        )
+        app.save_output = AsyncMock()
+
+        await app.process_input(str(test_file))
+
+        assert len(split_threads) == 1
+        assert split_threads[0] is not loop_thread
+
+    @pytest.mark.asyncio
+    async def test_cancelled_split_stops_before_cleanup(
+        self, app, temp_dir, monkeypatch
+    ):
+        """Cancelling mid-split signals the worker thread to stop and waits
+        for it before cleanup() removes the temp dir under ffmpeg."""
+        import threading
+
+        test_file = temp_dir / "test.mp3"
+        test_file.write_text("mock audio content")
+        monkeypatch.setattr(
+            "tracklistify.core.base.validate_input", lambda p: (p, True)
+        )
+
+        started = threading.Event()
+        events = []
+
+        def fake_split(path, duration_hint=None, stop=None):
+            started.set()
+            assert stop.wait(5), "stop was never signalled"
+            time.sleep(0.05)  # an in-flight ffmpeg call finishing
+            events.append("split returned")
+            return []
+
+        app.split_audio = fake_split
+        app.cleanup = AsyncMock(side_effect=lambda: events.append("cleanup"))
+
+        task = asyncio.create_task(app.process_input(str(test_file)))
+        assert await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert events == ["split returned", "cleanup"]
+
+    def test_split_audio_stop_skips_ffmpeg(self, app, temp_dir, monkeypatch):
+        """Once ``stop`` is set, no further ffmpeg process is started."""
+        import threading
+
+        monkeypatch.setattr(
+            "tracklistify.core.base.shutil.which", lambda name: "/usr/bin/ffmpeg"
+        )
+        run = Mock()
+        monkeypatch.setattr("tracklistify.core.base.subprocess.run", run)
+        stop = threading.Event()
+        stop.set()
+
+        segments = app.split_audio(
+            str(temp_dir / "mix.mp3"), duration_hint=600, stop=stop
+        )
+
+        assert segments == []
+        run.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_process_youtube_url(self, app, temp_dir, monkeypatch):
         """Test processing a YouTube URL."""
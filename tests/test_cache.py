@@ -9,7 +9,6 @@ from typing import Any, Dict
 
 # Third-party imports
 import pytest
-from freezegun import freeze_time
 
 # Local/package imports
 from tracklistify.cache import BaseCache, get_cache
@@ -32,6 +31,27 @@ TEST_DATA = {
 }
 
 
+class ManualClock:
+    """Injectable time source for invalidation strategies.
+
+    Starts at the wall clock (``BaseCache.set`` stamps entries with
+    ``time.time()``) and only moves when ``advance`` or ``sync`` is called.
+    """
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def sync(self) -> None:
+        """Re-anchor to the wall clock after writing fresh entries."""
+        self.now = time.time()
+
+
 @pytest.fixture
 def temp_cache_dir(tmp_path: Path) -> Path:
     """Create a temporary cache directory."""
@@ -75,36 +95,38 @@ async def test_basic_cache_operations(cache: BaseCache[Dict[str, Any]]):
 async def test_cache_ttl_invalidation(temp_cache_dir: Path):
     """Test TTL-based cache invalidation.
 
-    Uses ``freeze_time`` rather than a real ``time.sleep`` so the test
-    doesn't depend on wall-clock and can't flake under load.
+    Drives an injected clock rather than sleeping, so the test doesn't
+    depend on wall-clock and can't flake under load.
     """
+    clock = ManualClock()
     storage = JSONStorage(temp_cache_dir)
-    strategy = TTLStrategy(default_ttl=1)  # 1 second TTL
+    strategy = TTLStrategy(default_ttl=1, time_source=clock)  # 1 second TTL
     cache = BaseCache[Dict[str, Any]](storage=storage, invalidation_strategy=strategy)
 
     key = "ttl_test"
     value = {"data": "test"}
 
-    with freeze_time("2026-01-01 12:00:00") as frozen:
-        await cache.set(key, value, ttl=1)
+    await cache.set(key, value, ttl=1)
+    clock.sync()
 
-        # Verify value exists immediately after set
-        result = await cache.get(key)
-        assert result == value
+    # Verify value exists immediately after set
+    result = await cache.get(key)
+    assert result == value
 
-        # Advance past the TTL boundary
-        frozen.tick(delta=timedelta(seconds=1.1))
+    # Advance past the TTL boundary
+    clock.advance(1.1)
 
-        # Verify value is invalidated
-        result = await cache.get(key)
-        assert result is None
+    # Verify value is invalidated
+    result = await cache.get(key)
+    assert result is None
 
 
 @pytest.mark.asyncio
 async def test_cache_lru_invalidation(temp_cache_dir: Path):
     """Test LRU-based cache invalidation."""
+    clock = ManualClock()
     storage = JSONStorage(temp_cache_dir)
-    strategy = LRUStrategy(max_age=1)
+    strategy = LRUStrategy(max_age=1, time_source=clock)
     base_cache = BaseCache[Dict[str, Any]](
         storage=storage, invalidation_strategy=strategy
     )
@@ -112,9 +134,10 @@ async def test_cache_lru_invalidation(temp_cache_dir: Path):
     # Set multiple values
     for key, data in TEST_DATA.items():
         await base_cache.set(key, data["value"])
+    clock.sync()
 
-    # Wait for max_age
-    await asyncio.sleep(1.2)
+    # Move past max_age
+    clock.advance(1.2)
 
     # All entries should be invalid due to age
     assert await base_cache.get("key1") is None
@@ -124,19 +147,20 @@ async def test_cache_lru_invalidation(temp_cache_dir: Path):
     # Set values again
     for key, data in TEST_DATA.items():
         await base_cache.set(key, data["value"])
+    clock.sync()
 
     # Access key1 to make it most recently used
     assert await base_cache.get("key1") == TEST_DATA["key1"]["value"]
 
-    # Wait for slightly less than max_age
-    await asyncio.sleep(0.5)
+    # Move slightly less than max_age
+    clock.advance(0.5)
 
     # key1 should still be valid since it was accessed recently
     # and hasn't exceeded max_age
     assert await base_cache.get("key1") == TEST_DATA["key1"]["value"]
 
-    # Wait for more than max_age
-    await asyncio.sleep(1.0)
+    # Move past max_age
+    clock.advance(1.0)
 
     # Now key1 should be invalid
     assert await base_cache.get("key1") is None
@@ -311,6 +335,39 @@ async def test_composite_strategy(tmp_path):
     assert result is not None
 
 
+def test_ttl_should_invalidate_epoch_and_iso_created_at():
+    """Numeric and ISO ``created_at`` values age identically."""
+    clock = ManualClock()
+    strategy = TTLStrategy(default_ttl=10, time_source=clock)
+    created = clock.now
+    iso = datetime.fromtimestamp(created).isoformat()
+
+    for created_at in (created, int(created), iso):
+        clock.now = created + 5
+        entry = CacheEntry(key="k", value="v", metadata={"created_at": created_at})
+        assert not strategy.should_invalidate(entry)
+
+        clock.now = created + 11
+        assert strategy.should_invalidate(entry)
+
+
+@pytest.mark.asyncio
+async def test_ttl_should_invalidate_reads_basecache_created(
+    cache: BaseCache[Dict[str, Any]],
+):
+    """Entries written by BaseCache carry ``created``, not ``created_at``."""
+    await cache.set("fresh", {"v": 1})
+    entry = await cache._storage.get("fresh")
+    assert "created_at" not in entry["metadata"]
+
+    clock = ManualClock()
+    strategy = TTLStrategy(default_ttl=10, time_source=clock)
+    clock.now = entry["metadata"]["created"] + 5
+    assert not strategy.should_invalidate(entry)
+    clock.now = entry["metadata"]["created"] + 11
+    assert strategy.should_invalidate(entry)
+
+
 @pytest.mark.asyncio
 async def test_compression_handling(tmp_path):
     """Test compression handling in storage."""
@@ -391,6 +448,29 @@ async def test_cache_index_persistence(tmp_path):
     assert "persistent" in keys
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_cache_index_load_parses_bytes(tmp_path, monkeypatch, use_orjson):
+    """Index loads from raw bytes with or without orjson; bad bytes rebuild."""
+    import tracklistify.cache.index as index_mod
+
+    if not use_orjson:
+        monkeypatch.setattr(index_mod, "orjson", None)
+
+    index1 = CacheIndex(tmp_path)
+    await index1.add_entry("k", "k.cache", {"size": 1, "created": time.time()})
+    await index1.save()
+
+    index2 = CacheIndex(tmp_path)
+    await index2.load()
+    assert await index2.get_filename("k") == "k.cache"
+
+    (tmp_path / "cache.index.json").write_bytes(b"\xff{")
+    index3 = CacheIndex(tmp_path)
+    await index3.load()
+    assert await index3.get_filename("k") is None
+
+
 @pytest.mark.asyncio
 async def test_cache_index_rebuild(tmp_path):
     """Test cache index rebuild functionality."""
@@ -662,3 +742,248 @@ async def test_compression_read_uses_index_flag_not_sniff(tmp_path: Path):
     ):
         result_u = await storage.get("flag-uncompressed")
     assert result_u is not None and result_u["value"] == value_u
+
+
+@pytest.mark.asyncio
+async def test_orjson_storage_round_trip_and_interop(tmp_path: Path):
+    """ORJSONStorage writes plain JSON, so either backend reads the other's
+    entries — switching cache_storage_format keeps the cache warm."""
+    pytest.importorskip("orjson")
+    from tracklistify.cache.storage import ORJSONStorage
+
+    entry = CacheEntry(
+        key="k",
+        value={"data": "x" * 1000, "n": 1},
+        metadata={"compression": True, "created_at": datetime.now().isoformat()},
+    )
+    fast = ORJSONStorage(tmp_path)
+    await fast.write("k", entry)
+
+    assert (await fast.read("k"))["value"] == entry["value"]
+    assert (await JSONStorage(tmp_path).read("k"))["value"] == entry["value"]
+
+
+def test_create_cache_orjson_falls_back_without_the_package(tmp_path, monkeypatch):
+    """``orjson`` degrades to the stdlib backend when the package is absent;
+    ``json`` is always the stdlib backend."""
+    from tracklistify.cache import factory
+    from tracklistify.cache.factory import create_cache
+
+    assert type(create_cache(tmp_path, storage_format="json")._storage) is JSONStorage
+
+    monkeypatch.setattr(factory, "orjson", None)
+    fallback = create_cache(tmp_path, storage_format="orjson")._storage
+    assert type(fallback) is JSONStorage
+
+
+def test_create_cache_orjson_selects_orjson_storage(tmp_path):
+    pytest.importorskip("orjson")
+    from tracklistify.cache.factory import create_cache
+    from tracklistify.cache.storage import ORJSONStorage
+
+    storage = create_cache(tmp_path, storage_format="orjson")._storage
+    assert isinstance(storage, ORJSONStorage)
+
+
+def test_key_hasher_defaults_and_falls_back_to_sha256(monkeypatch):
+    """sha256 is the default; xxh3 without xxhash and unknown names fall back."""
+    import hashlib
+
+    from tracklistify.cache import storage as storage_mod
+
+    expected = hashlib.sha256(b"key1").hexdigest()
+    assert storage_mod._get_key_hasher("sha256")("key1") == expected
+    assert storage_mod._get_key_hasher("bogus")("key1") == expected
+
+    monkeypatch.setattr(storage_mod, "xxhash", None)
+    assert storage_mod._get_key_hasher("xxh3")("key1") == expected
+
+
+@pytest.mark.asyncio
+async def test_xxh3_key_hash_reads_existing_sha256_entries(tmp_path, monkeypatch):
+    """Switching cache_key_hash keeps old entries: the index stores filenames."""
+    xxhash = pytest.importorskip("xxhash")
+
+    entry = CacheEntry(key="k", value="v", metadata={})
+    await JSONStorage(tmp_path).set("k", entry)
+
+    monkeypatch.setattr(get_config(), "cache_key_hash", "xxh3")
+    fast = JSONStorage(tmp_path)
+    assert (await fast.get("k"))["value"] == "v"
+    assert fast._get_file_path("k").endswith(f"{xxhash.xxh3_128_hexdigest('k')}.cache")
+
+
+@pytest.mark.asyncio
+async def test_cleanup_persists_index_once_per_batch(tmp_path: Path, monkeypatch):
+    """Expired entries are evicted as a batch: every file goes, and the
+    index is written once rather than once per evicted key."""
+    storage = JSONStorage(tmp_path)
+    for i in range(5):
+        entry = CacheEntry(
+            key=f"k{i}", value=i, metadata={"created_at": datetime.now().isoformat()}
+        )
+        await storage.write(f"k{i}", entry)
+
+    saves = 0
+    real_save = storage._index.save
+
+    async def counting_save():
+        nonlocal saves
+        saves += 1
+        await real_save()
+
+    monkeypatch.setattr(storage._index, "save", counting_save)
+
+    assert await storage.cleanup(max_age=-1) == 5
+    assert saves == 1
+    assert list(tmp_path.glob("*.cache")) == []
+    assert await storage.list_keys() == []
+
+
+@pytest.mark.asyncio
+async def test_storage_hot_tier_skips_repeat_file_reads(tmp_path: Path, monkeypatch):
+    """A key read once is served from memory next time, as a fresh parse."""
+    storage = JSONStorage(tmp_path)
+    await storage.set("hot", {"key": "hot", "value": {"tracks": [1]}, "metadata": {}})
+    # Writes don't fill the tier: a key is written once per run and read
+    # back in a later process, so caching on set() would only cost memory.
+    assert not storage._hot
+
+    first = await storage.get("hot")
+    assert list(storage._hot) == ["hot"]
+
+    async def no_disk(path):
+        raise AssertionError("hot hit must not read the cache file")
+
+    monkeypatch.setattr("tracklistify.cache.storage._read_bytes", no_disk)
+    first["value"]["tracks"].append(2)
+    assert (await storage.get("hot"))["value"] == {"tracks": [1]}
+
+    # Writes and deletes drop the key so memory never shadows the file.
+    monkeypatch.undo()
+    await storage.set("hot", {"key": "hot", "value": "new", "metadata": {}})
+    assert "hot" not in storage._hot
+    assert (await storage.get("hot"))["value"] == "new"
+    await storage.delete("hot")
+    assert await storage.get("hot") is None
+
+
+@pytest.mark.asyncio
+async def test_storage_hot_tier_evicts_least_recently_used(tmp_path: Path):
+    storage = JSONStorage(tmp_path, memory_entries=2)
+    for key in ("a", "b", "c"):
+        await storage.set(key, {"key": key, "value": key, "metadata": {}})
+        await storage.get(key)
+    assert list(storage._hot) == ["b", "c"]
+    # Evicted keys read through from disk and re-enter the tier.
+    assert (await storage.get("a"))["value"] == "a"
+    assert list(storage._hot) == ["c", "a"]
+
+    disabled = JSONStorage(tmp_path, memory_entries=0)
+    assert (await disabled.get("b"))["value"] == "b"
+    assert not disabled._hot
+
+
+def test_storage_hot_tier_size_comes_from_config(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(get_config(), "cache_memory_entries", 7)
+    assert JSONStorage(tmp_path)._memory_entries == 7
+
+
+@pytest.mark.asyncio
+async def test_set_records_size_from_storage_serialization(
+    temp_cache_dir: Path, monkeypatch
+):
+    """BaseCache.set encodes once; size survives a reload via the index."""
+    cache = BaseCache[Dict[str, Any]](
+        storage=JSONStorage(temp_cache_dir),
+        invalidation_strategy=SizeStrategy(max_size=200),
+    )
+    calls = {"n": 0}
+    real_dumps = JSONStorage._dumps
+
+    def counting_dumps(self, entry):
+        calls["n"] += 1
+        return real_dumps(self, entry)
+
+    monkeypatch.setattr(JSONStorage, "_dumps", counting_dumps)
+    await cache.set("big", {"data": "x" * 1000})
+    assert calls["n"] == 1
+
+    fresh = JSONStorage(temp_cache_dir, memory_entries=0)
+    entry = await fresh.get("big")
+    assert entry["metadata"]["size"] > 1000
+    assert not await SizeStrategy(max_size=200).is_valid(entry)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_flat_orphans_and_skips_subdirs(tmp_path: Path):
+    storage = JSONStorage(tmp_path)
+    await storage.set("kept", {"key": "kept", "value": 1, "metadata": {}})
+    (tmp_path / "orphan.cache").write_text("{}")
+    nested = tmp_path / "downloads" / "x.cache"
+    nested.parent.mkdir()
+    nested.write_text("not ours")
+
+    assert await storage.cleanup(max_age=3600) == 1
+    assert not (tmp_path / "orphan.cache").exists()
+    assert nested.exists()
+    assert (await storage.get("kept"))["value"] == 1
+
+
+@pytest.mark.asyncio
+async def test_storage_locks_do_not_grow_per_key(tmp_path: Path):
+    storage = JSONStorage(tmp_path)
+    shards = len(storage._locks)
+    await asyncio.gather(
+        *(
+            storage.set(f"k{i}", {"key": f"k{i}", "value": i, "metadata": {}})
+            for i in range(200)
+        )
+    )
+    assert len(storage._locks) == shards
+    assert storage._get_lock("k1") is storage._get_lock("k1")
+    assert (await storage.get("k150"))["value"] == 150
+
+
+@pytest.mark.asyncio
+async def test_entry_writes_skip_fsync_and_torn_files_read_as_miss(
+    tmp_path: Path, monkeypatch
+):
+    def no_fsync(fd):
+        raise AssertionError("entry writes must not fsync")
+
+    storage = JSONStorage(tmp_path, memory_entries=0)
+    with monkeypatch.context() as m:
+        m.setattr("tracklistify.cache.storage.os.fsync", no_fsync)
+        m.setattr("tracklistify.cache.index.os.fsync", lambda fd: None)
+        await storage.set("k", {"key": "k", "value": 1, "metadata": {}})
+
+    # Simulate a crash that left a truncated entry behind.
+    Path(storage._get_file_path("k")).write_bytes(b'{"key": "k", "val')
+    assert await storage.get("k") is None
+    assert "k" not in await storage.list_keys()
+
+
+@pytest.mark.asyncio
+async def test_set_records_uncompressed_size_without_mutating_entry(tmp_path: Path):
+    storage = JSONStorage(tmp_path, memory_entries=0)
+    entry = {"key": "z", "value": "x" * 5000, "metadata": {"ttl": 60}}
+    await storage.set("z", entry, compression=True)
+
+    assert entry["metadata"] == {"ttl": 60}
+    index_size = (await storage._index.get_metadata("z"))["size"]
+    assert index_size == len(storage._dumps(entry))
+    assert (await storage.get("z"))["metadata"]["size"] == index_size
+
+
+@pytest.mark.asyncio
+async def test_cleanup_propagates_cancelled_eviction(tmp_path: Path, monkeypatch):
+    storage = JSONStorage(tmp_path)
+    await storage.set("old", {"key": "old", "value": 1, "metadata": {}})
+
+    async def cancelled_evict(key):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(storage, "_evict", cancelled_evict)
+    with pytest.raises(asyncio.CancelledError):
+        await storage.cleanup(max_age=-1)
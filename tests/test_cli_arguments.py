@@ -6,7 +6,8 @@ and that AsyncApp respects these argument overrides.
 """
 
 # Standard library imports
-from unittest.mock import AsyncMock, patch
+import os
+from unittest.mock import AsyncMock, Mock, patch
 
 # Third-party imports
 import pytest
@@ -25,6 +26,18 @@ class TestCLIParsing:
         args = parse_args(["test.mp3"])
         assert args.formats == "all"
 
+    def test_parser_is_built_once_without_state_bleed(self):
+        """The memoized parser must not carry values between calls."""
+        from tracklistify.cli import _get_parser
+
+        first = parse_args(["a.mp3", "-f", "json", "--no-cache"])
+        second = parse_args(["b.mp3"])
+
+        assert _get_parser() is _get_parser()
+        assert first.formats == "json" and first.no_cache is True
+        assert second.input == "b.mp3"
+        assert second.formats == "all" and second.no_cache is None
+
     def test_formats_json(self):
         """Test --formats json argument."""
         args = parse_args(["test.mp3", "-f", "json"])
@@ -89,7 +102,7 @@ class TestCLIArgumentPassing:
         test_file = tmp_path / "test.mp3"
         test_file.write_bytes(b"fake audio data")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(return_value=[])
             mock_app.close = AsyncMock()
@@ -109,7 +122,7 @@ class TestCLIArgumentPassing:
         test_file = tmp_path / "test.mp3"
         test_file.write_bytes(b"fake audio data")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(return_value=[])
             mock_app.close = AsyncMock()
@@ -151,7 +164,7 @@ class TestCLIDownloadErrorLogging:
         test_file = tmp_path / "test.mp3"
         test_file.write_bytes(b"fake audio")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(
                 side_effect=self._chained_download_error()
@@ -198,7 +211,7 @@ class TestCLIDownloadErrorLogging:
         test_file = tmp_path / "test.mp3"
         test_file.write_bytes(b"fake audio data")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(return_value=[])
             mock_app.close = AsyncMock()
@@ -219,7 +232,7 @@ class TestCLIDownloadErrorLogging:
         test_file = tmp_path / "test.mp3"
         test_file.write_bytes(b"fake audio data")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(return_value=[])
             mock_app.close = AsyncMock()
@@ -379,7 +392,7 @@ class TestCLIEndToEnd:
         test_file.write_bytes(b"fake audio data")
 
         # Mock AsyncApp methods to avoid real processing
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock(return_value=[])
             mock_app.close = AsyncMock()
@@ -428,7 +441,7 @@ class TestNoCacheFlag:
         test_file = tmp_path / "mix.mp3"
         test_file.write_bytes(b"audio")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock()
             mock_app.close = AsyncMock()
@@ -444,7 +457,7 @@ class TestNoCacheFlag:
         test_file = tmp_path / "mix.mp3"
         test_file.write_bytes(b"audio")
 
-        with patch("tracklistify.cli.AsyncApp") as mock_app_class:
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
             mock_app = AsyncMock()
             mock_app.process_input = AsyncMock()
             mock_app.close = AsyncMock()
@@ -477,6 +490,152 @@ class TestBareInvocation:
         assert exc.value.code != 0
 
 
+class TestLazyImports:
+    """``--help`` and argument errors must not pay for the provider stack."""
+
+    def test_importing_cli_does_not_load_app_or_config(self, modules_loaded_after):
+        heavy = ["tracklistify.core.base", "tracklistify.config", "dotenv"]
+        assert modules_loaded_after("import tracklistify.cli", heavy) == []
+
+
+@pytest.mark.asyncio
+class TestSignalHandlers:
+    """main() installs its shutdown handlers on the running loop and
+    removes them on the way out."""
+
+    async def test_handlers_removed_after_main_returns(self, tmp_path):
+        import asyncio
+        import signal
+
+        test_file = tmp_path / "test.mp3"
+        test_file.write_bytes(b"fake audio data")
+
+        with patch("tracklistify.core.AsyncApp") as mock_app_class:
+            mock_app_class.return_value = AsyncMock()
+            with patch.object(
+                asyncio, "get_event_loop", side_effect=AssertionError("deprecated")
+            ):
+                assert await main(parse_args([str(test_file)])) == 0
+
+        loop = asyncio.get_running_loop()
+        # remove_signal_handler returns False when nothing is installed.
+        assert loop.remove_signal_handler(signal.SIGINT) is False
+        assert loop.remove_signal_handler(signal.SIGTERM) is False
+
+
+class TestHelpFastPath:
+    """``--help`` and argparse errors exit before any setup work runs."""
+
+    @pytest.mark.parametrize("argv", [["--help"], ["test.mp3", "--nonsense"]])
+    def test_exits_before_logger_and_env_setup(self, monkeypatch, argv):
+        import tracklistify.cli as cli_mod
+
+        monkeypatch.setattr(cli_mod.sys, "argv", ["tracklistify", *argv])
+        set_logger = Mock()
+        load_env = Mock()
+        monkeypatch.setattr(cli_mod, "set_logger", set_logger)
+        monkeypatch.setattr(cli_mod, "load_environment_variables", load_env)
+
+        with pytest.raises(SystemExit):
+            cli_mod.cli()
+
+        set_logger.assert_not_called()
+        load_env.assert_not_called()
+
+
+class TestLoadEnvironmentVariables:
+    """``.env`` is parsed once; the debug listing covers only its keys."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_environ(self, monkeypatch):
+        """Loading writes straight into ``os.environ``; give each test a
+        throwaway copy so loaded keys can't leak into later tests."""
+        monkeypatch.setattr(os, "environ", dict(os.environ))
+
+    def test_file_values_load_but_process_env_wins(self, tmp_path, monkeypatch):
+        from tracklistify.cli import load_environment_variables
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("TRACKLISTIFY_A=from_file\nTRACKLISTIFY_B=from_file\n")
+        monkeypatch.delenv("TRACKLISTIFY_A", raising=False)
+        monkeypatch.setenv("TRACKLISTIFY_B", "from_shell")
+
+        load_environment_variables(env_file)
+
+        assert os.environ["TRACKLISTIFY_A"] == "from_file"
+        assert os.environ["TRACKLISTIFY_B"] == "from_shell"
+
+    def test_debug_listing_covers_only_file_keys(self, tmp_path, monkeypatch, caplog):
+        import logging
+
+        from tracklistify.cli import load_environment_variables
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("TRACKLISTIFY_IN_FILE=yes\n")
+        monkeypatch.setenv("TRACKLISTIFY_ONLY_IN_SHELL", "yes")
+        caplog.set_level(logging.DEBUG, logger="tracklistify.cli")
+
+        load_environment_variables(env_file)
+
+        assert "TRACKLISTIFY_IN_FILE=yes" in caplog.text
+        assert "TRACKLISTIFY_ONLY_IN_SHELL" not in caplog.text
+
+    def test_debug_listing_skipped_above_debug(self, tmp_path, monkeypatch, caplog):
+        import logging
+
+        import tracklistify.config.security as security
+        from tracklistify.cli import load_environment_variables
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("TRACKLISTIFY_IN_FILE=yes\n")
+        mask = Mock(side_effect=AssertionError("masking ran at INFO"))
+        monkeypatch.setattr(security, "mask_sensitive_value", mask)
+        caplog.set_level(logging.INFO, logger="tracklistify.cli")
+
+        load_environment_variables(env_file)
+
+        mask.assert_not_called()
+
+
+class TestEnvFileMemoization:
+    """An unchanged ``.env`` is parsed once; an edit forces a re-parse."""
+
+    def test_reparse_only_on_mtime_change(self, tmp_path, monkeypatch):
+        import dotenv
+
+        from tracklistify.cli import _parse_env_file, load_environment_variables
+
+        monkeypatch.setattr(os, "environ", dict(os.environ))
+        _parse_env_file.cache_clear()
+        env_file = tmp_path / ".env"
+        env_file.write_text("TRACKLISTIFY_X=1\n")
+        parse = Mock(wraps=dotenv.dotenv_values)
+        monkeypatch.setattr(dotenv, "dotenv_values", parse)
+
+        load_environment_variables(env_file)
+        load_environment_variables(env_file)
+        assert parse.call_count == 1
+
+        env_file.write_text("TRACKLISTIFY_X=2\n")
+        os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000))
+        load_environment_variables(env_file)
+        assert parse.call_count == 2
+        _parse_env_file.cache_clear()
+
+    def test_missing_file_is_a_no_op(self, tmp_path, monkeypatch):
+        import tracklistify.cli as cli_mod
+
+        monkeypatch.setattr(os, "environ", dict(os.environ))
+        before = dict(os.environ)
+        parse = Mock(side_effect=AssertionError("parsed a missing file"))
+        monkeypatch.setattr(cli_mod, "_parse_env_file", parse)
+
+        cli_mod.load_environment_variables(tmp_path / "absent.env")
+
+        parse.assert_not_called()
+        assert os.environ == before
+
+
 class TestNoCacheRefreshSemantics:
     """--no-cache must set cache_refresh, NOT cache_enabled=False.
 
@@ -26,6 +26,8 @@ from tracklistify.config.security import (
     mask_sensitive_value,
 )
 from tracklistify.config.validation import (
+    MultipleValidationError,
+    RangeValidationError,
     validate_optional_string,
     validate_path,
     validate_positive_float,
@@ -35,16 +37,22 @@ from tracklistify.config.validation import (
 )
 
 
-def test_default_config(monkeypatch):
-    """Test default configuration values (code defaults, no .env file)."""
-    # Clear all TRACKLISTIFY_ environment variables to test pure code defaults
-    env_vars_to_clear = [key for key in os.environ if key.startswith("TRACKLISTIFY_")]
-    for key in env_vars_to_clear:
-        monkeypatch.delenv(key, raising=False)
+@pytest.fixture(scope="module")
+def default_config():
+    """One code-defaults config (no TRACKLISTIFY_* env, no .env file).
 
-    # Ensure clean singleton state
-    clear_config()
-    config = TrackIdentificationConfig()
+    Shared by the tests in this module that only read it; tests that mutate
+    a config or depend on the singleton build their own.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key in [k for k in os.environ if k.startswith("TRACKLISTIFY_")]:
+            mp.delenv(key)
+        return TrackIdentificationConfig()
+
+
+def test_default_config(default_config):
+    """Test default configuration values (code defaults, no .env file)."""
+    config = default_config
 
     # Track identification settings - CODE DEFAULTS
     assert config.segment_length == 60
@@ -61,12 +69,15 @@ def test_default_config(monkeypatch):
     assert config.acrcloud_max_concurrent == 10  # Code default is 10
     assert config.shazam_max_rpm == 25
     assert config.shazam_max_concurrent == 1
+    assert config.provider_batch_size == 1  # one request per worker
 
     # Cache settings - CODE DEFAULTS
     assert config.cache_enabled is True
     assert config.cache_ttl == 2_592_000  # 30d; segment hash is the identity
     assert config.cache_max_size == 1_000_000  # bytes (~1MB), matches SizeStrategy
     assert config.cache_storage_format == "json"
+    assert config.cache_key_hash == "sha256"
+    assert config.cache_memory_entries == 256
     assert config.cache_compression_enabled is True
     assert config.cache_compression_level == 6
     assert config.cache_max_age == 2_592_000  # must not undercut cache_ttl
@@ -135,9 +146,97 @@ def test_custom_config(temp_test_dir, monkeypatch):
     assert config.log_dir == temp_test_dir / "env_log"
 
 
+def test_provider_batch_size_env_override_and_range(monkeypatch):
+    """provider_batch_size is env-configurable and bounded to 1..32."""
+    monkeypatch.setenv("TRACKLISTIFY_PROVIDER_BATCH_SIZE", "8")
+    assert TrackIdentificationConfig().provider_batch_size == 8
+
+    monkeypatch.setenv("TRACKLISTIFY_PROVIDER_BATCH_SIZE", "0")
+    with pytest.raises(RangeValidationError):
+        TrackIdentificationConfig()
+
+
+def test_validation_reports_every_failing_field(monkeypatch):
+    """All rule violations are collected into one error, not just the first."""
+    monkeypatch.setenv("TRACKLISTIFY_PROVIDER_BATCH_SIZE", "0")
+    monkeypatch.setenv("TRACKLISTIFY_MIN_CONFIDENCE", "1.5")
+    with pytest.raises(MultipleValidationError) as exc_info:
+        TrackIdentificationConfig()
+
+    errors = exc_info.value.errors
+    assert len(errors) == 2
+    assert all(isinstance(e, RangeValidationError) for e in errors)
+    message = str(exc_info.value)
+    assert "provider_batch_size" in message
+    assert "min_confidence" in message
+
+
+def test_env_overrides_reused_while_environment_unchanged(monkeypatch):
+    """Rebuilding with the same TRACKLISTIFY_* env reuses the parsed values;
+    changing the env is picked up and lists are never shared."""
+    from tracklistify.config.base import _parse_env_overrides
+
+    monkeypatch.setenv("TRACKLISTIFY_FALLBACK_PROVIDERS", "shazam,acrcloud")
+    clear_config()
+
+    first = TrackIdentificationConfig()
+    hits = _parse_env_overrides.cache_info().hits
+    second = TrackIdentificationConfig()
+    assert _parse_env_overrides.cache_info().hits == hits + 1
+
+    # Variables that map to no field are not part of the snapshot
+    monkeypatch.setenv("TRACKLISTIFY_NOT_A_FIELD", "x")
+    TrackIdentificationConfig()
+    assert _parse_env_overrides.cache_info().hits == hits + 2
+
+    assert first.fallback_providers == ["shazam", "acrcloud"]
+    first.fallback_providers.append("spotify")
+    assert second.fallback_providers == ["shazam", "acrcloud"]
+
+    monkeypatch.setenv("TRACKLISTIFY_FALLBACK_PROVIDERS", "acrcloud")
+    assert TrackIdentificationConfig().fallback_providers == ["acrcloud"]
+    clear_config()
+
+
+def test_env_override_cache_tracks_home_directory(monkeypatch, tmp_path):
+    """``~`` in a path override follows HOME between builds, with no
+    clear_config() in between."""
+    monkeypatch.setenv("TRACKLISTIFY_TEMP_DIR", "~/t")
+    for home in ("h1", "h2"):
+        monkeypatch.setenv("HOME", str(tmp_path / home))
+        assert TrackIdentificationConfig().temp_dir == tmp_path / home / "t"
+
+
+def test_env_parsers_convert_by_field_type(monkeypatch, tmp_path):
+    """Each field's env converter is chosen from its declared type."""
+    from tracklistify.config import base
+
+    monkeypatch.setattr(base, "get_root", lambda: tmp_path)
+    monkeypatch.setenv("TRACKLISTIFY_DEBUG", "Yes")
+    monkeypatch.setenv("TRACKLISTIFY_SEGMENT_LENGTH", "90  # seconds")
+    monkeypatch.setenv("TRACKLISTIFY_MIN_CONFIDENCE", "0.5")
+    monkeypatch.setenv("TRACKLISTIFY_OUTPUT_FORMAT", "markdown")
+    monkeypatch.setenv("TRACKLISTIFY_TEMP_DIR", "relative/temp")
+    # Env-only settings (e.g. credentials) have no field and are skipped
+    monkeypatch.setenv("TRACKLISTIFY_BEATPORT_TOKEN", "not-a-field")
+
+    config = TrackIdentificationConfig()
+    assert not hasattr(config, "beatport_token")
+    assert config.debug is True
+    assert config.segment_length == 90
+    assert config.min_confidence == 0.5
+    assert config.output_format == "markdown"
+    assert config.temp_dir == tmp_path / "relative/temp"
+
+    monkeypatch.setenv("TRACKLISTIFY_SEGMENT_LENGTH", "ninety")
+    with pytest.raises(ValueError, match="TRACKLISTIFY_SEGMENT_LENGTH.*valid int"):
+        TrackIdentificationConfig()
+
+
 def test_validation_positive_float():
     """Test validation of positive float values."""
     assert validate_positive_float(1.0, "test") == 1.0
+    assert type(validate_positive_float(2, "test")) is float
 
     with pytest.raises(TypeError):
         validate_positive_float("not a number", "test")
@@ -153,6 +252,9 @@ def test_validation_positive_int():
     """Test validation of positive integer values."""
     assert validate_positive_int(1, "test") == 1
 
+    with pytest.raises(TypeError):
+        validate_positive_int(True, "test")
+
     with pytest.raises(TypeError):
         validate_positive_int(1.5, "test")
 
@@ -166,6 +268,7 @@ def test_validation_positive_int():
 def test_validation_probability():
     """Test validation of probability values."""
     assert validate_probability(0.5, "test") == 0.5
+    assert validate_probability(1, "test") == 1.0
 
     with pytest.raises(TypeError):
         validate_probability("not a number", "test")
@@ -193,6 +296,33 @@ def test_validation_path():
         test_dir.rmdir()
 
 
+def test_path_rule_creates_and_checks_directories(tmp_path):
+    """PathRule creates missing directories once and type-checks via stat."""
+    from tracklistify.config.validation import (
+        PathRequirement,
+        PathRule,
+        PathValidationError,
+    )
+
+    reqs = {PathRequirement.IS_DIR, PathRequirement.WRITABLE}
+    rule = PathRule("cache_dir", reqs, create_if_missing=True)
+
+    target = tmp_path / "a" / "b"
+    rule.validate(target)
+    assert target.is_dir()
+    assert not (target / ".write_test").exists()
+    rule.validate(target)  # existing directory
+
+    a_file = tmp_path / "file.txt"
+    a_file.write_text("x")
+    with pytest.raises(PathValidationError, match="must be a directory"):
+        rule.validate(a_file)
+
+    exists_rule = PathRule("log_file", {PathRequirement.EXISTS})
+    with pytest.raises(PathValidationError, match="does not exist"):
+        exists_rule.validate(tmp_path / "missing")
+
+
 def test_string_list_validation():
     """Test validation of string lists."""
     valid_list = ["item1", "item2"]
@@ -207,6 +337,13 @@ def test_string_list_validation():
     with pytest.raises(TypeError, match="test_list must contain only strings"):
         validate_string_list(["valid", 1], "test_list")
 
+    class Name(str):
+        pass
+
+    mixed = ["plain", Name("subclass")]
+    assert validate_string_list(mixed, "test_list") == mixed
+    assert validate_string_list([], "test_list") == []
+
 
 def test_optional_string_validation():
     """Test validation of optional strings."""
@@ -269,9 +406,9 @@ def test_sensitive_value_masking():
     assert "***" in masked["settings"]["token"]
 
 
-def test_config_documentation_generation():
+def test_config_documentation_generation(default_config):
     """Test configuration documentation generation."""
-    config = TrackIdentificationConfig()
+    config = default_config
     doc_gen = ConfigDocGenerator(config._validator)
 
     # Test field documentation
@@ -302,6 +439,20 @@ def test_config_documentation_generation():
     assert "## Configuration Fields" in full_docs
 
 
+def test_documentation_is_memoized_per_class(default_config):
+    """Doc text depends only on the schema: instances share their class's
+    cached output and the markdown is rendered once per generator."""
+    config = default_config
+
+    assert generate_field_docs(config) is generate_field_docs(TrackIdentificationConfig)
+    assert generate_validation_docs(
+        TrackIdentificationConfig
+    ) is generate_validation_docs(config)
+
+    doc_gen = ConfigDocGenerator(config._validator)
+    assert doc_gen.generate_markdown() is doc_gen.generate_markdown()
+
+
 def test_config_validation_edge_cases():
     """Test configuration validation edge cases."""
     # Test empty paths
@@ -333,9 +484,9 @@ def test_config_validation_edge_cases():
         validate_probability("invalid", "test")
 
 
-def test_config_to_dict_with_sensitive_data():
+def test_config_to_dict_with_sensitive_data(default_config):
     """Test configuration dict conversion with sensitive data handling."""
-    config = TrackIdentificationConfig()
+    config = default_config
 
     # Add some sensitive data
     sensitive_data = {
@@ -361,65 +512,45 @@ def test_config_to_dict_with_sensitive_data():
     assert "***" in masked_dict["credentials"]["password"]
 
 
-def test_env_config():
-    """Test configuration from environment variables."""
-    # Clear any existing singleton first
-    clear_config()
+def test_env_config(monkeypatch, tmp_path):
+    """Test configuration from environment variables.
+
+    HOME points at ``tmp_path`` so the ``~`` paths expand (and get created)
+    inside the test's own directory; monkeypatch restores the environment.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
 
     # Test base directory settings
-    os.environ["TRACKLISTIFY_OUTPUT_DIR"] = "~/.tracklistify/output"
-    os.environ["TRACKLISTIFY_CACHE_DIR"] = "~/.tracklistify/cache"
-    os.environ["TRACKLISTIFY_TEMP_DIR"] = "~/.tracklistify/temp"
+    monkeypatch.setenv("TRACKLISTIFY_OUTPUT_DIR", "~/.tracklistify/output")
+    monkeypatch.setenv("TRACKLISTIFY_CACHE_DIR", "~/.tracklistify/cache")
+    monkeypatch.setenv("TRACKLISTIFY_TEMP_DIR", "~/.tracklistify/temp")
 
     # Test other settings
-    os.environ["TRACKLISTIFY_TIME_THRESHOLD"] = "45.0"
-    os.environ["TRACKLISTIFY_MAX_DUPLICATES"] = "4"
-    os.environ["TRACKLISTIFY_MIN_CONFIDENCE"] = "0.95"
-
-    try:
-        config = get_config()
-
-        # Verify base directory settings
-        expected_output = Path("~/.tracklistify/output").expanduser()
-        assert config.output_dir == expected_output
-        expected_cache = Path("~/.tracklistify/cache").expanduser()
-        assert config.cache_dir == expected_cache
-        expected_temp = Path("~/.tracklistify/temp").expanduser()
-        assert config.temp_dir == expected_temp
-
-        # Verify other settings
-        assert config.time_threshold == 45.0
-        assert config.min_confidence == 0.95
-
-        # Verify directories are created
-        assert config.output_dir.exists()
-        assert config.cache_dir.exists()
-        assert config.temp_dir.exists()
+    monkeypatch.setenv("TRACKLISTIFY_TIME_THRESHOLD", "45.0")
+    monkeypatch.setenv("TRACKLISTIFY_MAX_DUPLICATES", "4")
+    monkeypatch.setenv("TRACKLISTIFY_MIN_CONFIDENCE", "0.95")
 
-    finally:
-        # Clean up environment variables
-        del os.environ["TRACKLISTIFY_OUTPUT_DIR"]
-        del os.environ["TRACKLISTIFY_CACHE_DIR"]
-        del os.environ["TRACKLISTIFY_TEMP_DIR"]
-        del os.environ["TRACKLISTIFY_TIME_THRESHOLD"]
-        del os.environ["TRACKLISTIFY_MAX_DUPLICATES"]
-        del os.environ["TRACKLISTIFY_MIN_CONFIDENCE"]
+    # Clear any existing singleton first
+    clear_config()
+    config = get_config()
 
-        # Clear singleton for next test
-        clear_config()
+    # Verify base directory settings
+    assert config.output_dir == tmp_path / ".tracklistify/output"
+    assert config.cache_dir == tmp_path / ".tracklistify/cache"
+    assert config.temp_dir == tmp_path / ".tracklistify/temp"
 
-        # Clean up created directories recursively
-        import shutil
+    # Verify other settings
+    assert config.time_threshold == 45.0
+    assert config.min_confidence == 0.95
 
-        for dir_path in [config.output_dir, config.cache_dir, config.temp_dir]:
-            # Convert string paths to Path objects for consistent handling
-            if isinstance(dir_path, str):
-                dir_path = Path(dir_path).expanduser()
-            elif isinstance(dir_path, Path):
-                dir_path = dir_path.expanduser()
+    # Verify directories are created
+    assert config.output_dir.exists()
+    assert config.cache_dir.exists()
+    assert config.temp_dir.exists()
 
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
+    # Clear singleton for next test
+    clear_config()
 
 
 def test_directory_creation():
@@ -441,17 +572,37 @@ def test_directory_creation():
         config.temp_dir.rmdir()
 
 
-def test_to_dict(monkeypatch):
+def test_directory_creation_skips_existing_and_rejects_files(tmp_path):
+    """Existing directories are reused; a file in the way is still an error."""
+    existing = tmp_path / "output"
+    existing.mkdir()
+    config = TrackIdentificationConfig(
+        output_dir=existing,
+        cache_dir=tmp_path / "cache",
+        temp_dir=tmp_path / "temp",
+        log_dir=tmp_path / "log",
+    )
+    assert config.output_dir.is_dir()
+    assert config.cache_dir.is_dir()
+
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    with pytest.raises(ValueError, match="Failed to create directory"):
+        TrackIdentificationConfig(
+            output_dir=blocker,
+            cache_dir=tmp_path / "cache",
+            temp_dir=tmp_path / "temp",
+            log_dir=tmp_path / "log",
+        )
+
+
+def test_to_dict(default_config):
     """Test conversion to dictionary.
 
-    Clears verbose/debug env overrides so the test doesn't depend on the
-    developer's local `.env` (which commonly enables both for CLI runs).
+    Uses the env-free default config so the test doesn't depend on the
+    developer's local `.env` (which commonly enables verbose/debug).
     """
-    monkeypatch.delenv("TRACKLISTIFY_VERBOSE", raising=False)
-    monkeypatch.delenv("TRACKLISTIFY_DEBUG", raising=False)
-    # Ensure clean singleton state
-    clear_config()
-    config = TrackIdentificationConfig()
+    config = default_config
     from dataclasses import asdict
 
     config_dict = asdict(config)
@@ -468,10 +619,21 @@ def test_to_dict(monkeypatch):
     assert config_dict["debug"] is False  # default when env unset
 
 
-def test_documentation():
+def test_config_import_defers_optional_modules(modules_loaded_after):
+    """``import tracklistify.config`` leaves docs and security unloaded;
+    ``ConfigDocGenerator`` still resolves from the package on first access."""
+    docs = "tracklistify.config.docs"
+    optional = [docs, "tracklistify.config.security"]
+
+    assert modules_loaded_after("import tracklistify.config", optional) == []
+    lazy = "from tracklistify.config import ConfigDocGenerator"
+    assert modules_loaded_after(lazy, optional) == [docs]
+
+
+def test_documentation(default_config):
     """Test documentation generation."""
     # Test configuration docs generation with actual implementation
-    config = TrackIdentificationConfig()
+    config = default_config
     doc_gen = ConfigDocGenerator(config._validator)
     docs = doc_gen.generate_markdown()
 
@@ -481,7 +643,7 @@ def test_documentation():
     assert has_fields or has_title
 
 
-def test_get_config():
+def test_get_config(monkeypatch):
     """Test get_config singleton function."""
     # Clear any existing instance
     clear_config()
@@ -497,18 +659,11 @@ def test_get_config():
     assert config2 is config1  # Same instance
 
     # Test environment variable override
-    original_threshold = os.environ.get("TRACKLISTIFY_TIME_THRESHOLD")
-    os.environ["TRACKLISTIFY_TIME_THRESHOLD"] = "120.0"
+    monkeypatch.setenv("TRACKLISTIFY_TIME_THRESHOLD", "120.0")
     clear_config()  # Clear instance to force reload from environment
 
     config3 = get_config()
     assert config3.time_threshold == 120.0
-
-    # Clean up - restore original value
-    if original_threshold is not None:
-        os.environ["TRACKLISTIFY_TIME_THRESHOLD"] = original_threshold
-    else:
-        del os.environ["TRACKLISTIFY_TIME_THRESHOLD"]
     clear_config()
 
 
@@ -658,3 +813,56 @@ def test_beatport_secrets_are_not_config_fields(monkeypatch):
         assert not hasattr(cfg, name)
     assert "super-secret-id" not in repr(cfg)
     assert "hunter2" not in repr(cfg)
+
+
+class TestGetRoot:
+    """Project-root discovery in config/paths.py."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_root_cache(self, monkeypatch):
+        from tracklistify.config.paths import clear_root
+
+        monkeypatch.delenv("TRACKLISTIFY_PROJECT_ROOT", raising=False)
+        clear_root()
+        yield
+        clear_root()
+
+    def test_source_checkout_finds_pyproject(self):
+        from tracklistify.config.paths import get_root
+
+        assert (get_root() / "pyproject.toml").is_file()
+
+    def test_zipimported_package_skips_the_walk(self, tmp_path, monkeypatch):
+        """No real file means no directory tree: fall back to cwd without
+        stat-ing every ancestor of the archive."""
+        import tracklistify.config.paths as paths
+
+        (tmp_path / "pyproject.toml").write_text("")
+        monkeypatch.setattr(
+            paths, "__file__", str(tmp_path / "app.zip" / "tracklistify" / "paths.py")
+        )
+        monkeypatch.chdir(tmp_path / "..")
+
+        assert paths.get_root() == Path.cwd()
+
+    def test_walk_returns_nearest_pyproject_ancestor(self, tmp_path, monkeypatch):
+        import tracklistify.config.paths as paths
+
+        (tmp_path / "pyproject.toml").write_text("")
+        module = tmp_path / "src" / "pkg" / "config" / "paths.py"
+        module.parent.mkdir(parents=True)
+        module.write_text("")
+        monkeypatch.setattr(paths, "__file__", str(module))
+
+        assert paths.get_root() == tmp_path
+
+    def test_walk_stops_at_filesystem_root(self, tmp_path, monkeypatch):
+        import tracklistify.config.paths as paths
+
+        module = tmp_path / "pkg" / "paths.py"
+        module.parent.mkdir()
+        module.write_text("")
+        monkeypatch.setattr(paths, "__file__", str(module))
+        monkeypatch.chdir(tmp_path)
+
+        assert paths.get_root() == tmp_path
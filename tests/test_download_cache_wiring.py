@@ -130,9 +130,9 @@ class TestDownloadCacheWiring:
         captured_path = []
         original_split = app.split_audio
 
-        def spy_split(file_path, duration_hint=None):
+        def spy_split(file_path, duration_hint=None, stop=None):
             captured_path.append(str(file_path))
-            return original_split(file_path, duration_hint=duration_hint)
+            return original_split(file_path, duration_hint=duration_hint, stop=stop)
 
         app.split_audio = spy_split
         await app.process_input(url, stream_copy=True)
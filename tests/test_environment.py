@@ -1,13 +1,40 @@
 """Environment validation tests for Tracklistify."""
 
 # Standard library imports
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Third-party imports
 import pytest
 
+# External tool probes, run concurrently once per module (fork/exec dominates)
+_TOOL_COMMANDS = {
+    "ffmpeg": ["ffmpeg", "-version"],
+    "git": ["git", "--version"],
+    "git-dir": ["git", "rev-parse", "--git-dir"],
+}
+
+
+def _run_tool(cmd):
+    """Run a probe command, returning the result or the exception raised."""
+    try:
+        return subprocess.run(cmd, capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        return e
+
+
+@pytest.fixture(scope="module")
+def tool_results():
+    """Map each probe name to its CompletedProcess or exception."""
+    with ThreadPoolExecutor(max_workers=len(_TOOL_COMMANDS)) as pool:
+        futures = {
+            name: pool.submit(_run_tool, cmd) for name, cmd in _TOOL_COMMANDS.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
 
 def test_python_version():
     """Test Python version meets minimum requirements."""
@@ -18,51 +45,52 @@ def test_python_version():
     )
 
 
-def test_ffmpeg_installed():
+def test_ffmpeg_installed(tool_results):
     """Test ffmpeg is installed and accessible."""
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    result = tool_results["ffmpeg"]
+    if isinstance(result, FileNotFoundError):
         pytest.skip("ffmpeg not installed - required for audio processing")
-    except subprocess.CalledProcessError as e:
-        pytest.fail(f"ffmpeg is installed but not working: {e}")
+    if isinstance(result, subprocess.CalledProcessError):
+        pytest.fail(f"ffmpeg is installed but not working: {result}")
 
 
-def test_git_installed():
+def test_git_installed(tool_results):
     """Test git is installed and accessible."""
-    try:
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        pytest.fail(f"git is not installed or not accessible: {e}")
+    result = tool_results["git"]
+    if isinstance(result, Exception):
+        pytest.fail(f"git is not installed or not accessible: {result}")
 
 
-def test_env_file_exists():
-    """Test .env file exists in project root."""
-    env_file = Path(".env")
-    env_example = Path(".env.example")
+@pytest.fixture(scope="module")
+def root_entries():
+    """Names in the project root, listed once instead of one stat per file."""
+    return frozenset(os.listdir("."))
 
-    assert env_example.exists(), ".env.example file is missing"
-    if not env_file.exists():
+
+def test_env_file_exists(root_entries):
+    """Test .env file exists in project root."""
+    assert ".env.example" in root_entries, ".env.example file is missing"
+    if ".env" not in root_entries:
         pytest.skip(".env file not found - copy .env.example to .env and configure")
 
 
-def test_precommit_config_exists():
+def test_precommit_config_exists(root_entries):
     """Test pre-commit configuration exists."""
-    config_file = Path(".pre-commit-config.yaml")
-    assert config_file.exists(), ".pre-commit-config.yaml is missing"
+    assert ".pre-commit-config.yaml" in root_entries, (
+        ".pre-commit-config.yaml is missing"
+    )
 
 
-def test_precommit_installed():
+def test_precommit_installed(tool_results):
     """Test pre-commit hooks are installed in git."""
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"], capture_output=True, check=True
-        )
-        hooks_dir = Path(".git/hooks")
-        pre_commit_hook = hooks_dir / "pre-commit"
-        if not pre_commit_hook.exists():
-            pytest.skip(
-                "pre-commit hook not installed - run 'pre-commit install' to set up"
-            )
-    except subprocess.CalledProcessError:
+    result = tool_results["git-dir"]
+    if isinstance(result, subprocess.CalledProcessError):
         pytest.skip("Not a git repository")
+    if isinstance(result, FileNotFoundError):
+        raise result
+    hooks_dir = Path(".git/hooks")
+    pre_commit_hook = hooks_dir / "pre-commit"
+    if not pre_commit_hook.exists():
+        pytest.skip(
+            "pre-commit hook not installed - run 'pre-commit install' to set up"
+        )
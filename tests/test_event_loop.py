@@ -0,0 +1,58 @@
+"""
+Tests for the optional uvloop event loop selection.
+"""
+
+# Standard library imports
+import asyncio
+import sys
+import types
+
+# Local/package imports
+from tracklistify.utils import event_loop
+
+
+class TestUvloopFactory:
+    """uvloop is optional: used when importable, silently skipped otherwise."""
+
+    def test_missing_uvloop_returns_none(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uvloop", None)  # import -> ImportError
+
+        assert event_loop.uvloop_factory() is None
+
+    def test_installed_uvloop_returns_its_loop_constructor(self, monkeypatch):
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.new_event_loop = asyncio.new_event_loop
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+        assert event_loop.uvloop_factory() is asyncio.new_event_loop
+
+
+class TestRunAsync:
+    """run_async uses the factory's loop and never touches the global policy."""
+
+    def test_runs_on_the_factory_loop(self, monkeypatch):
+        created = []
+
+        def factory():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        monkeypatch.setattr(event_loop, "uvloop_factory", lambda: factory)
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert event_loop.run_async(current_loop()) is created[0]
+
+    def test_leaves_event_loop_policy_untouched(self, monkeypatch):
+        monkeypatch.setattr(
+            event_loop, "uvloop_factory", lambda: asyncio.new_event_loop
+        )
+        policy = asyncio.get_event_loop_policy()
+
+        async def answer():
+            return 42
+
+        assert event_loop.run_async(answer()) == 42
+        assert asyncio.get_event_loop_policy() is policy
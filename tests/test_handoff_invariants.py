@@ -410,7 +410,7 @@ class TestCliFfmpegCheck:
 
     def test_cli_proceeds_with_ffmpeg(self, monkeypatch):
         """With ffmpeg present, cli() must get past the check (we stop it
-        at asyncio.run to avoid a real run)."""
+        at run_async to avoid a real run)."""
         from tracklistify import cli as cli_mod
 
         monkeypatch.setattr(cli_mod.shutil, "which", lambda name: "/usr/bin/ffmpeg")
@@ -418,13 +418,11 @@ class TestCliFfmpegCheck:
             cli_mod.sys, "argv", ["tracklistify", "http://youtube.com/watch?v=x"]
         )
 
-        def fake_asyncio_run(coro):
+        def fake_run_async(coro):
             coro.close()  # avoid "coroutine never awaited" warnings
             return 0
 
-        with patch.object(
-            cli_mod.asyncio, "run", side_effect=fake_asyncio_run
-        ) as fake_run:
+        with patch.object(cli_mod, "run_async", side_effect=fake_run_async) as fake_run:
             with pytest.raises(SystemExit) as exc_info:
                 cli_mod.cli()
         assert fake_run.called
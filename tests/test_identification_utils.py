@@ -6,9 +6,12 @@ Tests for Phase 2, Issue #3: Implement stub functions
 - ProgressDisplay class
 """
 
+import asyncio
 import pytest
 import time
 import sys
+from types import SimpleNamespace
+
 from tracklistify.utils.identification import (
     format_duration,
     create_progress_bar,
@@ -335,8 +338,6 @@ class TestExtraMetadata:
 
     def test_track_from_info_attaches_metadata(self):
         """The extras reach Track.metadata through the real build path."""
-        from types import SimpleNamespace
-
         from tracklistify.config import get_config
         from tracklistify.utils.identification import IdentificationManager
 
@@ -375,7 +376,6 @@ class TestZeroMatchWarning:
     @pytest.mark.asyncio
     async def test_full_miss_on_a_long_run_warns(self, caplog):
         import logging
-        from types import SimpleNamespace
 
         from tracklistify.config import get_config
         from tracklistify.utils.identification import IdentificationManager
@@ -398,7 +398,6 @@ class TestZeroMatchWarning:
         """Below the threshold a zero-match run is unremarkable — warning
         there would cry wolf on a short clip that genuinely has nothing."""
         import logging
-        from types import SimpleNamespace
 
         from tracklistify.config import get_config
         from tracklistify.utils.identification import IdentificationManager
@@ -427,7 +426,6 @@ class TestCacheRefresh:
 
     @pytest.mark.asyncio
     async def test_refresh_ignores_the_stored_result_and_overwrites_it(self):
-        from types import SimpleNamespace
         from unittest.mock import AsyncMock
 
         from tracklistify.config import get_config
@@ -479,7 +477,6 @@ class TestCacheRefresh:
 
     @pytest.mark.asyncio
     async def test_without_refresh_the_cache_is_read(self):
-        from types import SimpleNamespace
         from unittest.mock import AsyncMock
 
         from tracklistify.config import get_config
@@ -524,3 +521,181 @@ class TestCacheRefresh:
         assert tracks and tracks[0].song_name == "CACHED"
         # A hit short-circuits the provider entirely.
         provider.identify_track.assert_not_awaited()
+
+
+class TestConcurrentSegments:
+    """Segments are identified concurrently, bounded by
+    ``max_concurrent_requests``, and reported in segment order."""
+
+    class _CountingProvider:
+        """``identify_track`` stand-in that records peak concurrency."""
+
+        def __init__(self, delay=0):
+            self.delay = delay
+            self.in_flight = 0
+            self.peak = 0
+
+        async def identify(self, segment):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(self.delay)
+            self.in_flight -= 1
+            return TestConcurrentSegments._resp(f"Track {segment.start_time}")
+
+    @pytest.fixture
+    def make_manager(self, monkeypatch):
+        """Build a manager on a private config and rate limiter.
+
+        Nothing process-wide is touched: the global config singleton and
+        the global limiter are left as they were, so no setting leaks into
+        later tests.
+        """
+        from unittest.mock import AsyncMock, Mock
+
+        from tracklistify.config import TrackIdentificationConfig
+        from tracklistify.utils.identification import IdentificationManager
+        from tracklistify.utils.rate_limiter import RateLimiter
+
+        def make(identify, **overrides):
+            cfg = TrackIdentificationConfig()
+            cfg.cache_enabled = False
+            cfg.max_concurrent_requests = 2
+            for name, value in overrides.items():
+                setattr(cfg, name, value)
+            limiter = RateLimiter(cfg)
+            monkeypatch.setattr(
+                "tracklistify.utils.identification.get_global_rate_limiter",
+                lambda: limiter,
+            )
+
+            provider = AsyncMock()
+            provider.identify_track = identify
+            provider.__aenter__ = AsyncMock(return_value=provider)
+            provider.__aexit__ = AsyncMock(return_value=False)
+
+            mgr = IdentificationManager(
+                config=cfg, provider_factory=object(), cache=Mock()
+            )
+            # acrcloud's limiter allows concurrent requests; shazam's is serial.
+            mgr._provider_chain = lambda: ["acrcloud"]
+            mgr.provider_factory = SimpleNamespace(
+                get_identification_provider=lambda name: provider
+            )
+            return mgr
+
+        return make
+
+    @staticmethod
+    def _resp(title):
+        return {
+            "metadata": {
+                "music": [
+                    {"title": title, "artists": [{"name": "Artist"}], "score": 90.0}
+                ]
+            }
+        }
+
+    @staticmethod
+    def _segments(n):
+        return [
+            SimpleNamespace(start_time=i * 300, file_path=f"seg{i}.mp3")
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_segment_does_not_block_the_next(self, make_manager):
+        """Segment 0 only answers once segment 1 has started. Run serially
+        it would time out and be lost; run concurrently both match."""
+        second_started = asyncio.Event()
+
+        async def identify(segment):
+            if segment.start_time == 0:
+                await asyncio.wait_for(second_started.wait(), timeout=2)
+            else:
+                second_started.set()
+            return self._resp(f"Track {segment.start_time}")
+
+        mgr = make_manager(identify)
+        tracks = await mgr.identify_tracks(self._segments(2))
+
+        assert [t.song_name for t in tracks] == ["Track 0", "Track 300"]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_segments_are_bounded(self, make_manager):
+        provider = self._CountingProvider()
+
+        mgr = make_manager(provider.identify)
+        tracks = await mgr.identify_tracks(self._segments(6))
+
+        assert provider.peak == 2
+        assert len(tracks) == 6
+
+    @pytest.mark.asyncio
+    async def test_lazy_segment_source_is_consumed_incrementally(self, make_manager):
+        """Segments can come from a generator; the queue caps how far the
+        producer runs ahead of identification."""
+        produced = 0
+        identified = 0
+        max_ahead = 0
+
+        def segment_source():
+            nonlocal produced, max_ahead
+            for segment in self._segments(20):
+                produced += 1
+                max_ahead = max(max_ahead, produced - identified)
+                yield segment
+
+        async def identify(segment):
+            nonlocal identified
+            await asyncio.sleep(0)
+            identified += 1
+            return self._resp(f"Track {segment.start_time}")
+
+        mgr = make_manager(identify)
+        tracks = await mgr.identify_tracks(segment_source())
+
+        assert len(tracks) == 20
+        # queue depth (2 * workers) + one segment held per worker + the put
+        # currently blocked in the producer.
+        assert max_ahead <= 2 * 2 + 2 + 1
+
+    @pytest.mark.asyncio
+    async def test_queued_segments_are_batched_per_worker(self, make_manager):
+        """With ``provider_batch_size`` > 1 a worker submits everything
+        already queued together, so in-flight requests exceed the worker
+        count — but never workers * batch size."""
+        provider = self._CountingProvider()
+
+        mgr = make_manager(provider.identify, provider_batch_size=3)
+        tracks = await mgr.identify_tracks(self._segments(12))
+
+        assert [t.song_name for t in tracks] == [f"Track {i * 300}" for i in range(12)]
+        assert 2 < provider.peak <= 2 * 3
+
+    @pytest.mark.asyncio
+    async def test_batch_fills_beyond_twice_the_worker_count(self, make_manager):
+        """The queue is deep enough for a worker to coalesce a full batch,
+        not just ``2 * workers`` segments."""
+        provider = self._CountingProvider(delay=0.01)
+
+        # acrcloud's limiter allows 5 at once; one worker asking for 5.
+        mgr = make_manager(
+            provider.identify, max_concurrent_requests=1, provider_batch_size=5
+        )
+        tracks = await mgr.identify_tracks(self._segments(10))
+
+        assert len(tracks) == 10
+        assert provider.peak == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_is_capped_by_a_serial_limiter(self, make_manager):
+        """Under Shazam's one-at-a-time limiter, batching must not pile up
+        waiters on ``acquire``: every segment is still identified."""
+        provider = self._CountingProvider()
+
+        mgr = make_manager(provider.identify, provider_batch_size=8)
+        mgr._provider_chain = lambda: ["shazam"]
+        tracks = await mgr.identify_tracks(self._segments(12))
+
+        assert provider.peak == 1
+        assert [t.song_name for t in tracks] == [f"Track {i * 300}" for i in range(12)]
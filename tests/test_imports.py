@@ -12,6 +12,33 @@ def test_package_import():
     importlib.import_module("tracklistify")
 
 
+def test_package_metadata_attributes():
+    import tracklistify
+
+    assert tracklistify.__title__ == "tracklistify"
+    assert tracklistify.__version__
+    assert tracklistify.__license__ == "MIT"
+    # Read once; later calls reuse the parsed metadata
+    assert tracklistify.get_metadata() is tracklistify.get_metadata()
+
+
+def test_version_literal_matches_pyproject():
+    """_version.py is what the package imports; cz bump must keep it in step."""
+    import tomllib
+    from pathlib import Path
+
+    from tracklistify import _version
+
+    pyproject = Path(__file__).parent.parent / "pyproject.toml"
+    project = tomllib.loads(pyproject.read_text())["project"]
+    assert _version.__version__ == project["version"]
+    assert _version.__title__ == project["name"]
+
+
+def test_package_import_skips_importlib_metadata(modules_loaded_after):
+    assert modules_loaded_after("import tracklistify", ["importlib.metadata"]) == []
+
+
 def test_core_imports():
     from tracklistify.core import (  # noqa: F401
         ApplicationError,
@@ -31,3 +58,12 @@ def test_provider_imports():
 
 def test_downloader_imports():
     import tracklistify.downloaders.ytdlp  # noqa: F401
+
+
+def test_app_import_defers_yt_dlp(modules_loaded_after):
+    """yt_dlp is only imported once a URL needs a downloader."""
+    app = "import tracklistify.core.base"
+    downloader = "from tracklistify.downloaders import YtDlpDownloader"
+
+    assert modules_loaded_after(app, ["yt_dlp"]) == []
+    assert modules_loaded_after(f"{app}\n{downloader}", ["yt_dlp"]) == ["yt_dlp"]
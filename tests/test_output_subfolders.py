@@ -97,3 +97,10 @@ class TestFormatsLandInsideSubfolder:
         path = out.save("m3u")
         assert path == out.output_dir / "tracklist.m3u"
         assert path.is_file()
+
+    def test_unknown_format_writes_nothing(self, monkeypatch, tmp_path):
+        _config_with_output_dir(monkeypatch, tmp_path)
+        mix_info = {"artist": "A", "title": "B", "date": "2026-07-31"}
+        out = TracklistOutput(mix_info=mix_info, tracks=[_make_track()])
+        assert out.save("xml") is None
+        assert list(out.output_dir.iterdir()) == []
@@ -0,0 +1,61 @@
+"""
+Tests for the legacy ``core/run.py`` entry point's startup checks.
+"""
+
+# Standard library imports
+import subprocess
+
+# Third-party imports
+import pytest
+
+# Local/package imports
+from tracklistify.core import run
+
+
+class TestCheckDependencies:
+    """ffmpeg is located on PATH without spawning a subprocess."""
+
+    def test_executable_ffmpeg_passes_without_spawning(self, tmp_path, monkeypatch):
+        ffmpeg = tmp_path / "ffmpeg"
+        ffmpeg.write_text("#!/bin/sh\n")
+        ffmpeg.chmod(0o755)
+        monkeypatch.setattr("pydub.utils.which", lambda name: str(ffmpeg))
+
+        def no_subprocess(*args, **kwargs):
+            raise AssertionError("check_dependencies must not spawn ffmpeg")
+
+        monkeypatch.setattr(subprocess, "run", no_subprocess)
+
+        run.check_dependencies()
+
+    def test_missing_ffmpeg_exits(self, monkeypatch):
+        monkeypatch.setattr("pydub.utils.which", lambda name: None)
+
+        with pytest.raises(SystemExit) as exc:
+            run.check_dependencies()
+
+        assert exc.value.code == 1
+
+
+class TestSetupEnvironment:
+    """A missing .env is seeded from .env.example, then the run stops."""
+
+    def test_copies_example_and_exits(self, tmp_path, monkeypatch):
+        example = "TRACKLISTIFY_DEBUG=false  # comment kept verbatim\n"
+        (tmp_path / ".env.example").write_text(example)
+        monkeypatch.setattr(run, "get_root", lambda: tmp_path)
+
+        with pytest.raises(SystemExit) as exc:
+            run.setup_environment()
+
+        assert exc.value.code == 1
+        assert (tmp_path / ".env").read_text() == example
+
+    def test_existing_env_is_left_alone(self, tmp_path, monkeypatch):
+        (tmp_path / ".env.example").write_text("A=example\n")
+        (tmp_path / ".env").write_text("A=mine\n")
+        monkeypatch.setattr(run, "get_root", lambda: tmp_path)
+
+        run.setup_environment()
+
+        assert (tmp_path / ".env").read_text() == "A=mine\n"
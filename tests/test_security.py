@@ -1,6 +1,11 @@
 """Tests for tracklistify.config.security."""
 
-from tracklistify.config.security import is_sensitive_field
+from tracklistify.config.security import (
+    SENSITIVE_PATTERNS,
+    detect_sensitive_fields,
+    is_sensitive_field,
+    mask_sensitive_data,
+)
 
 
 def test_is_sensitive_field_uppercase_envvar():
@@ -13,3 +18,53 @@ def test_is_sensitive_field_uppercase_envvar():
     assert is_sensitive_field("acr_access_key") is True
     assert is_sensitive_field("OUTPUT_DIR") is False
     assert is_sensitive_field("verbose") is False
+
+
+def test_is_sensitive_field_matches_substring_semantics():
+    """The compiled pattern agrees with a plain lowercase substring test."""
+    names = [
+        "TRACKLISTIFY_ACR_ACCESS_SECRET",
+        "Spotify_Client_Id",
+        "max_duplicates",
+        "AUTHOR",
+        "output_format",
+        "https_proxy",
+    ]
+    for name in names:
+        expected = any(p in name.lower() for p in SENSITIVE_PATTERNS)
+        assert is_sensitive_field(name) is expected
+
+
+def test_detect_sensitive_fields_deeply_nested():
+    """Nested dicts are walked to any depth and reported with dotted paths."""
+    data: dict = {"token": "t"}
+    node = data
+    for level in range(50):
+        node["child"] = {"name": level, "secret": "s"}
+        node = node["child"]
+
+    found = detect_sensitive_fields(data)
+
+    assert "token" in found
+    assert "child.secret" in found
+    assert ".".join(["child"] * 50) + ".secret" in found
+    assert len(found) == 51
+
+
+def test_mask_sensitive_data_nested_preserves_shape():
+    """Nested levels are masked in place without mutating the input; key
+    order and non-string values are kept."""
+    data = {
+        "name": "mix",
+        "acr": {"access_key": "abcdefghijklmnop", "timeout": 10},
+        "deep": {"a": {"b": {"token": "short"}}},
+        "api_key": 12345,
+    }
+
+    masked = mask_sensitive_data(data)
+
+    assert list(masked) == ["name", "acr", "deep", "api_key"]
+    assert masked["acr"] == {"access_key": "abc*****nop", "timeout": 10}
+    assert masked["deep"]["a"]["b"]["token"] == "***"
+    assert masked["api_key"] == 12345
+    assert data["acr"]["access_key"] == "abcdefghijklmnop"
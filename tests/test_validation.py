@@ -136,3 +136,25 @@ class TestPlatformURLScheme:
         from tracklistify.utils.validation import is_youtube_url
 
         assert is_youtube_url("https://www.youtube.com/watch?v=abc") is True
+
+    def test_non_string_rejected(self):
+        from tracklistify.utils.validation import is_youtube_url
+
+        assert is_youtube_url(b"https://youtube.com/watch?v=abc") is False
+        assert is_youtube_url(None) is False
+
+    def test_hostname_parsed_once_per_url(self):
+        from tracklistify.utils.validation import (
+            _http_hostname,
+            is_mixcloud_url,
+            is_soundcloud_url,
+            is_youtube_url,
+        )
+
+        url = "https://m.youtube.com/watch?v=parsed-once"
+        _http_hostname.cache_clear()
+        assert is_youtube_url(url) is True
+        assert is_soundcloud_url(url) is False
+        assert is_mixcloud_url(url) is False
+        info = _http_hostname.cache_info()
+        assert (info.misses, info.hits) == (1, 2)